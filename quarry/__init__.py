@@ -1,13 +1,34 @@
 """Quarry: A reusable Python toolkit for web/data collection."""
 
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from quarry.lib.lazy import lazy_module_attrs
+
 __version__ = "2.0.0"
 
-from quarry.core import run_job
-from quarry.lib.http import create_session, get_html
-from quarry.lib.policy import check_robots, is_allowed_domain
-from quarry.lib.ratelimit import DomainRateLimiter
-from quarry.lib.robots import RobotsCache
-from quarry.state import get_failed_urls, record_failed_url
+if TYPE_CHECKING:
+    from quarry.core import run_job
+    from quarry.lib.http import create_session, get_html
+    from quarry.lib.policy import check_robots, is_allowed_domain
+    from quarry.lib.ratelimit import DomainRateLimiter
+    from quarry.lib.robots import RobotsCache
+    from quarry.state import get_failed_urls, record_failed_url
+
+# Public names are resolved on first access (PEP 562) so importing a single
+# submodule, e.g. the CLI entry point, does not load pandas via quarry.core.
+_LAZY_ATTRS = {
+    "DomainRateLimiter": "quarry.lib.ratelimit",
+    "RobotsCache": "quarry.lib.robots",
+    "check_robots": "quarry.lib.policy",
+    "create_session": "quarry.lib.http",
+    "get_failed_urls": "quarry.state",
+    "get_html": "quarry.lib.http",
+    "is_allowed_domain": "quarry.lib.policy",
+    "record_failed_url": "quarry.state",
+    "run_job": "quarry.core",
+}
 
 __all__ = [
     "DomainRateLimiter",
@@ -20,3 +41,6 @@ __all__ = [
     "record_failed_url",
     "run_job",
 ]
+
+
+__getattr__, __dir__ = lazy_module_attrs(__name__, _LAZY_ATTRS)
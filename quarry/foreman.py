@@ -21,7 +21,7 @@ from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.syntax import Syntax
 from rich.table import Table
 
-from quarry.lib import paths
+from quarry.lib import fastjson, paths
 from quarry.lib.theme import COLORS, QUARRY_THEME, QUESTIONARY_STYLE
 
 console = Console(theme=QUARRY_THEME)
@@ -540,9 +540,9 @@ def _step_excavate(state: TutorialState) -> bool:
 
         # Save to JSONL
         _ensure_dir(FOREMAN_DIR)
-        with state.raw_file.open("w", encoding="utf-8") as f:
+        with state.raw_file.open("wb") as f:
             for item in items:
-                f.write(json.dumps(item, ensure_ascii=False) + "\n")
+                f.write(fastjson.dumps_line(item))
 
         # Show results
         _display_extracted_data(state, items)
@@ -713,9 +713,9 @@ def _apply_polish_operations(state: TutorialState, polish_ops: list[str]) -> dic
             state.polished_data = polished
 
         # Save polished data
-        with state.polished_file.open("w", encoding="utf-8") as f:
+        with state.polished_file.open("wb") as f:
             for item in polished:
-                f.write(json.dumps(item, ensure_ascii=False) + "\n")
+                f.write(fastjson.dumps_line(item))
 
         return {"duplicates": duplicates, "stripped": stripped}
 
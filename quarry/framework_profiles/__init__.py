@@ -34,18 +34,32 @@ FRAMEWORK_PROFILES: list[type[FrameworkProfile]] = [
     WordPressProfile,  # Generic CMS (might match "post" class from others)
 ]
 
+# Profiles keyed by their ``name`` attribute, for callers that already know
+# (or want to confirm) which framework a site uses
+PROFILES_BY_NAME: dict[str, type[FrameworkProfile]] = {
+    profile.name: profile for profile in FRAMEWORK_PROFILES
+}
 
-def detect_framework(html: str, item_element: Tag | None = None) -> type[FrameworkProfile] | None:
+
+def detect_framework(
+    html: str, item_element: Tag | None = None, hint: str | None = None
+) -> type[FrameworkProfile] | None:
     """
     Detect which framework is being used (returns best match above threshold).
 
     Args:
         html: Full page HTML
         item_element: Optional item container element
+        hint: Optional profile name (e.g. "wordpress") to check first; if it
+            scores above the threshold the other profiles are not probed
 
     Returns:
         Detected framework profile class or None if no match above threshold (40)
     """
+    hinted = PROFILES_BY_NAME.get(hint) if hint else None
+    if hinted is not None and hinted.detect(html, item_element) >= 40:
+        return hinted
+
     best_score = 0
     best_profile = None
 
@@ -136,6 +150,7 @@ def is_framework_pattern(selector: str, framework: type[FrameworkProfile] | None
 
 __all__ = [
     "FRAMEWORK_PROFILES",
+    "PROFILES_BY_NAME",
     "BootstrapProfile",
     "DjangoAdminProfile",
     "FrameworkProfile",
@@ -21,6 +21,24 @@ def _get_element_classes(element: Tag) -> str:
     return str(classes)
 
 
+def _get_element_class_names(element: Tag) -> list[str]:
+    """
+    Get element's classes as a list of class names.
+
+    Args:
+        element: BeautifulSoup Tag element
+
+    Returns:
+        Class names in document order, or an empty list if no classes
+    """
+    classes = element.get("class")
+    if classes is None:
+        return []
+    if isinstance(classes, list):
+        return classes
+    return str(classes).split()
+
+
 class FrameworkProfile:
     """Base class for framework-specific detection profiles."""
 
@@ -2,7 +2,10 @@
 
 from bs4 import Tag
 
-from ..base import FrameworkProfile, _get_element_classes
+from ..base import FrameworkProfile, _get_element_class_names
+
+# Item container classes, matched as whole class names
+_ITEM_CLASSES = frozenset({"post", "entry", "hentry", "article"})
 
 
 class WordPressProfile(FrameworkProfile):
@@ -29,8 +32,7 @@ class WordPressProfile(FrameworkProfile):
 
         # Check item element
         if item_element:
-            classes = _get_element_classes(item_element)
-            if any(indicator in classes for indicator in ["post", "entry", "hentry", "article"]):
+            if not _ITEM_CLASSES.isdisjoint(_get_element_class_names(item_element)):
                 score += 20
 
         return min(score, 100)
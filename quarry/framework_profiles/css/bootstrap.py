@@ -2,7 +2,10 @@
 
 from bs4 import Tag
 
-from ..base import FrameworkProfile, _get_element_classes
+from ..base import FrameworkProfile, _get_element_class_names
+
+# Item container classes, matched as whole class names
+_ITEM_CLASSES = frozenset({"card", "list-group-item", "media"})
 
 
 class BootstrapProfile(FrameworkProfile):
@@ -31,8 +34,7 @@ class BootstrapProfile(FrameworkProfile):
 
         # Check item element
         if item_element:
-            classes = _get_element_classes(item_element)
-            if any(indicator in classes for indicator in ["card", "list-group-item", "media"]):
+            if not _ITEM_CLASSES.isdisjoint(_get_element_class_names(item_element)):
                 score += 20
 
         return min(score, 100)
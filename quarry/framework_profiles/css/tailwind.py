@@ -37,8 +37,20 @@ class TailwindProfile(FrameworkProfile):
             "lg:",
         ]
 
-        # Count pattern matches (need multiple since these are generic)
-        matches = sum(1 for pattern in tailwind_patterns if pattern in html)
+        # Count pattern matches (need multiple since these are generic).
+        # Each miss scans the whole page, so stop as soon as the score
+        # bracket is settled: 10 matches is the top score, and fewer than 4
+        # reachable matches means no score at all.
+        matches = 0
+        remaining = len(tailwind_patterns)
+        for pattern in tailwind_patterns:
+            remaining -= 1
+            if pattern in html:
+                matches += 1
+                if matches >= 10:
+                    break
+            elif matches + remaining < 4:
+                break
 
         # Scale score based on matches (need at least 5 for confidence)
         if matches >= 10:
@@ -1,12 +1,30 @@
 """Schema.org microdata and JSON-LD profile for structured data extraction."""
 
 import json
+import re
 from typing import Any
 
-from bs4 import BeautifulSoup, Tag
+from bs4 import Tag
 
 from quarry.framework_profiles.base import FrameworkProfile
 
+# <script type="application/ld+json"> blocks, matched in the raw HTML so
+# detection doesn't have to build a parse tree for the whole page
+_JSON_LD_SCRIPT = re.compile(
+    r"""<script\b[^>]*?\btype\s*=\s*(["']?)application/ld\+json\1(?=[\s/>])[^>]*>"""
+    r"""(?P<json>.*?)</script\s*>""",
+    re.IGNORECASE | re.DOTALL,
+)
+
+# Slower form that also consumes comments and other scripts, so blocks inside
+# <!-- ... --> are skipped and "<!--" in script text doesn't open a comment
+_JSON_LD_OR_SKIPPED = re.compile(
+    r"""<(?:!--.*?(?:-->|\Z)"""
+    r"""|script\b(?:[^>]*?\btype\s*=\s*(["']?)application/ld\+json\1(?=[\s/>])[^>]*>"""
+    r"""(?P<json>.*?)|[^>]*>.*?)</script\s*>)""",
+    re.IGNORECASE | re.DOTALL,
+)
+
 
 class SchemaOrgProfile(FrameworkProfile):
     """
@@ -30,16 +48,15 @@ class SchemaOrgProfile(FrameworkProfile):
         Returns:
             List of parsed JSON-LD objects (may be empty)
         """
-        soup = BeautifulSoup(html, "html.parser")
-        json_ld_scripts = soup.find_all("script", type="application/ld+json")
+        matches = list(_JSON_LD_SCRIPT.finditer(html))
+        # Rescan only if a block may sit inside a comment still open before it
+        if any(html.rfind("<!--", 0, m.start()) > html.rfind("-->", 0, m.start()) for m in matches):
+            matches = [m for m in _JSON_LD_OR_SKIPPED.finditer(html) if m.group("json") is not None]
 
         parsed_objects = []
-        for script in json_ld_scripts:
+        for match in matches:
             try:
-                text = script.string
-                if not isinstance(text, str):
-                    continue
-                data = json.loads(text)
+                data = json.loads(match.group("json"))
                 # Handle both single objects and arrays
                 if isinstance(data, list):
                     parsed_objects.extend(data)
@@ -89,10 +106,13 @@ class SchemaOrgProfile(FrameworkProfile):
             ("Organization", 10),
         ]
 
-        for schema_type, type_score in schema_types:
-            if f"schema.org/{schema_type}" in html or f'"@type":"{schema_type}"' in html:
-                score += type_score
-                break  # Only add bonus once
+        # Most pages contain neither form at all, so check the shared
+        # prefixes once before scanning for each type
+        if "schema.org/" in html or '"@type":"' in html:
+            for schema_type, type_score in schema_types:
+                if f"schema.org/{schema_type}" in html or f'"@type":"{schema_type}"' in html:
+                    score += type_score
+                    break  # Only add bonus once
 
         return score
 
@@ -9,26 +9,67 @@ Provides foundational utilities used by all scraping tools:
 - Interactive prompts with validation and retry logic
 """
 
-from .http import create_session, get_html, get_rate_limiter, set_rate_limiter
-from .policy import check_robots, is_allowed_domain
-from .prompts import (
-    RetryablePrompt,
-    prompt_choice,
-    prompt_confirm,
-    prompt_file,
-    prompt_text,
-    prompt_url,
-)
-from .ratelimit import DomainRateLimiter, TokenBucket
-from .robots import RobotsCache
-from .selectors import (
-    SelectorChain,
-    build_fallback_chain,
-    build_robust_selector,
-    extract_structural_pattern,
-    simplify_selector,
-    validate_selector,
-)
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from .lazy import lazy_module_attrs
+
+if TYPE_CHECKING:
+    from .http import (
+        create_session,
+        get_html,
+        get_html_many,
+        get_rate_limiter,
+        set_rate_limiter,
+    )
+    from .policy import check_robots, is_allowed_domain
+    from .prompts import (
+        RetryablePrompt,
+        prompt_choice,
+        prompt_confirm,
+        prompt_file,
+        prompt_text,
+        prompt_url,
+    )
+    from .ratelimit import DomainRateLimiter, TokenBucket
+    from .robots import RobotsCache
+    from .selectors import (
+        SelectorChain,
+        build_fallback_chain,
+        build_robust_selector,
+        extract_structural_pattern,
+        simplify_selector,
+        validate_selector,
+    )
+
+# Re-exports are loaded on first access (PEP 562) so that importing a light
+# submodule such as quarry.lib.paths does not pull in requests (via .http) or
+# questionary/prompt_toolkit (via .prompts).
+_LAZY_ATTRS = {
+    "DomainRateLimiter": ".ratelimit",
+    "RetryablePrompt": ".prompts",
+    "RobotsCache": ".robots",
+    "SelectorChain": ".selectors",
+    "TokenBucket": ".ratelimit",
+    "build_fallback_chain": ".selectors",
+    "build_robust_selector": ".selectors",
+    "check_robots": ".policy",
+    "create_session": ".http",
+    "extract_structural_pattern": ".selectors",
+    "get_html": ".http",
+    "get_html_many": ".http",
+    "get_rate_limiter": ".http",
+    "is_allowed_domain": ".policy",
+    "prompt_choice": ".prompts",
+    "prompt_confirm": ".prompts",
+    "prompt_file": ".prompts",
+    "prompt_text": ".prompts",
+    "prompt_url": ".prompts",
+    "set_rate_limiter": ".http",
+    "simplify_selector": ".selectors",
+    "validate_selector": ".selectors",
+}
 
 __all__ = [
     "DomainRateLimiter",
@@ -42,6 +83,7 @@ __all__ = [
     "create_session",
     "extract_structural_pattern",
     "get_html",
+    "get_html_many",
     "get_rate_limiter",
     "is_allowed_domain",
     "prompt_choice",
@@ -53,3 +95,6 @@ __all__ = [
     "simplify_selector",
     "validate_selector",
 ]
+
+
+__getattr__, __dir__ = lazy_module_attrs(__name__, _LAZY_ATTRS)
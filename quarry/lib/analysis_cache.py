@@ -0,0 +1,102 @@
+"""Disk cache for scout page analyses, keyed by URL and HTML content."""
+
+import hashlib
+import json
+import sqlite3
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
+
+from quarry import __version__
+from quarry.lib import paths
+
+_CACHE_TTL_SECONDS = 86400  # 24 hours
+
+
+class AnalysisCache:
+    """
+    Cache analyze_page() results with TTL-based invalidation.
+
+    Entries are keyed by a hash of the URL and the fetched HTML, so a page
+    whose content changed misses the cache. The Quarry version is part of
+    the key so an upgraded analyzer never serves results from an older one.
+    """
+
+    def __init__(self, db_path: str | None = None, ttl_seconds: float = _CACHE_TTL_SECONDS):
+        """Initialize analysis cache with SQLite backend."""
+        self.db_path = db_path or str(paths.default_scout_cache_path())
+        self.ttl_seconds = ttl_seconds
+        self._ensure_db()
+
+    def _ensure_db(self) -> None:
+        """Create analysis cache table if it doesn't exist."""
+        db_file = Path(self.db_path)
+        db_file.parent.mkdir(parents=True, exist_ok=True)
+
+        conn = sqlite3.connect(self.db_path)
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS analysis_cache (
+                key TEXT PRIMARY KEY,
+                analysis TEXT,
+                created_at TEXT
+            )
+        """
+        )
+        conn.commit()
+        conn.close()
+
+    @staticmethod
+    def make_key(html: str, url: str | None = None) -> str:
+        """Return the cache key for a page's HTML and URL."""
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(__version__.encode())
+        digest.update(b"\0")
+        digest.update((url or "").encode())
+        digest.update(b"\0")
+        digest.update(html.encode("utf-8", "surrogatepass"))
+        return digest.hexdigest()
+
+    def get(self, html: str, url: str | None = None) -> dict[str, Any] | None:
+        """
+        Return the cached analysis for a page, or None on a miss.
+
+        Expired entries count as misses.
+        """
+        conn = sqlite3.connect(self.db_path)
+        row = conn.execute(
+            "SELECT analysis, created_at FROM analysis_cache WHERE key = ?",
+            (self.make_key(html, url),),
+        ).fetchone()
+        conn.close()
+
+        if not row:
+            return None
+
+        created_at = datetime.fromisoformat(row[1])
+        age = (datetime.now(timezone.utc) - created_at).total_seconds()
+        if age >= self.ttl_seconds:
+            return None
+
+        analysis: dict[str, Any] = json.loads(row[0])
+        return analysis
+
+    def put(self, html: str, url: str | None, analysis: dict[str, Any]) -> None:
+        """Store the analysis for a page, dropping expired entries."""
+        now = datetime.now(timezone.utc)
+        expired_before = (now - timedelta(seconds=self.ttl_seconds)).isoformat()
+
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("DELETE FROM analysis_cache WHERE created_at < ?", (expired_before,))
+        conn.execute(
+            """
+            INSERT INTO analysis_cache (key, analysis, created_at)
+            VALUES (?, ?, ?)
+            ON CONFLICT(key) DO UPDATE SET
+                analysis = excluded.analysis,
+                created_at = excluded.created_at
+        """,
+            (self.make_key(html, url), json.dumps(analysis, ensure_ascii=False), now.isoformat()),
+        )
+        conn.commit()
+        conn.close()
@@ -0,0 +1,96 @@
+"""JSON encoding and decoding, using orjson when it is installed.
+
+orjson is an optional speedup (``pip install 'py-quarry[fast]'``). Every
+function here falls back to the standard library whenever orjson would read
+or write a value differently: integers wider than 64 bits, NaN/Infinity,
+and non-string dict keys.
+Dates and datetimes are rejected with TypeError on both paths, as
+json.dumps does, rather than being written as ISO strings by orjson only.
+"""
+
+import json
+import math
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None  # type: ignore[assignment]
+
+# Maps every digit byte to b"0" and everything else to a space, so a search
+# for _LONG_DIGIT_RUN finds numbers that may not fit in 64 bits.
+_DIGIT_MASK = bytes(48 if b in b"0123456789" else 32 for b in range(256))
+_LONG_DIGIT_RUN = b"0" * 19
+
+# Compact, reusable encoder for when orjson is unavailable or declines a value
+_JSON_ENCODER = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False)
+
+# Hand date/datetime/time to default= (or raise) instead of serializing them
+_OPT_PASSTHROUGH = orjson.OPT_PASSTHROUGH_DATETIME if orjson is not None else 0
+
+
+def has_non_finite(obj: Any) -> bool:
+    """
+    Check whether obj contains a NaN or infinite float at any depth.
+
+    orjson writes these as null where the standard library writes NaN and
+    Infinity, so callers use this to pick the standard library instead.
+    Float subclasses are skipped: orjson rejects them with TypeError anyway.
+    """
+    if type(obj) is float:
+        return not math.isfinite(obj)
+    if isinstance(obj, dict):
+        obj = obj.values()
+    elif not isinstance(obj, (list, tuple)):
+        return False
+
+    # Exact type checks first: this runs on every record before orjson does
+    for value in obj:
+        value_type = type(value)
+        if value_type is str or value_type is int or value is None:
+            continue
+        if value_type is float:
+            if not math.isfinite(value):
+                return True
+        elif isinstance(value, (dict, list, tuple)) and has_non_finite(value):
+            return True
+    return False
+
+
+def loads(data: bytes) -> Any:
+    """
+    Decode a JSON document, e.g. one JSONL line.
+
+    orjson rejects NaN/Infinity and turns integers wider than 64 bits into
+    floats, where the standard library keeps them exact. Documents containing
+    a run of 19+ digits, or that orjson rejects, are decoded with json.loads.
+
+    Raises:
+        json.JSONDecodeError: If data is not valid JSON
+    """
+    if orjson is not None and _LONG_DIGIT_RUN not in data.translate(_DIGIT_MASK):
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+def dumps(obj: Any) -> str:
+    """Serialize obj to compact JSON text without escaping non-ASCII characters."""
+    if orjson is not None and not has_non_finite(obj):
+        try:
+            return orjson.dumps(obj, option=_OPT_PASSTHROUGH).decode()
+        except TypeError:
+            pass  # e.g. wide integers or non-string dict keys, which the stdlib handles
+    return _JSON_ENCODER.encode(obj)
+
+
+def dumps_line(obj: Any) -> bytes:
+    """Serialize obj as one UTF-8 JSONL line, including the trailing newline."""
+    if orjson is not None and not has_non_finite(obj):
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE | _OPT_PASSTHROUGH)
+        except TypeError:
+            pass  # e.g. wide integers or non-string dict keys, which the stdlib handles
+    return (_JSON_ENCODER.encode(obj) + "\n").encode("utf-8")
@@ -0,0 +1,96 @@
+"""Disk cache for fetched page HTML, keyed by URL."""
+
+import sqlite3
+import zlib
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from quarry.lib import paths
+from quarry.lib.http import get_html
+
+_CACHE_TTL_SECONDS = 3600  # 1 hour
+
+
+class HtmlCache:
+    """
+    Cache get_html() results with TTL-based invalidation.
+
+    Lets the miner re-enter schema creation for the same URL without
+    downloading the page again. Pages are stored zlib-compressed; the TTL
+    is short so edits to the live page show up within the hour.
+    """
+
+    def __init__(self, db_path: str | None = None, ttl_seconds: float = _CACHE_TTL_SECONDS):
+        """Initialize HTML cache with SQLite backend."""
+        self.db_path = db_path or str(paths.default_html_cache_path())
+        self.ttl_seconds = ttl_seconds
+        self._ensure_db()
+
+    def _ensure_db(self) -> None:
+        """Create HTML cache table if it doesn't exist."""
+        db_file = Path(self.db_path)
+        db_file.parent.mkdir(parents=True, exist_ok=True)
+
+        conn = sqlite3.connect(self.db_path)
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS html_cache (
+                url TEXT PRIMARY KEY,
+                html BLOB,
+                fetched_at TEXT
+            )
+        """
+        )
+        conn.commit()
+        conn.close()
+
+    def get(self, url: str) -> str | None:
+        """
+        Return the cached HTML for a URL, or None on a miss.
+
+        Expired entries count as misses.
+        """
+        conn = sqlite3.connect(self.db_path)
+        row = conn.execute(
+            "SELECT html, fetched_at FROM html_cache WHERE url = ?", (url,)
+        ).fetchone()
+        conn.close()
+
+        if not row:
+            return None
+
+        fetched_at = datetime.fromisoformat(row[1])
+        age = (datetime.now(timezone.utc) - fetched_at).total_seconds()
+        if age >= self.ttl_seconds:
+            return None
+
+        return zlib.decompress(row[0]).decode("utf-8", "surrogatepass")
+
+    def put(self, url: str, html: str) -> None:
+        """Store the HTML for a URL, dropping expired entries."""
+        now = datetime.now(timezone.utc)
+        expired_before = (now - timedelta(seconds=self.ttl_seconds)).isoformat()
+        compressed = zlib.compress(html.encode("utf-8", "surrogatepass"), 1)
+
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("DELETE FROM html_cache WHERE fetched_at < ?", (expired_before,))
+        conn.execute(
+            """
+            INSERT INTO html_cache (url, html, fetched_at)
+            VALUES (?, ?, ?)
+            ON CONFLICT(url) DO UPDATE SET
+                html = excluded.html,
+                fetched_at = excluded.fetched_at
+        """,
+            (url, compressed, now.isoformat()),
+        )
+        conn.commit()
+        conn.close()
+
+    def fetch(self, url: str) -> str:
+        """Return the page HTML, downloading it only on a cache miss."""
+        html = self.get(url)
+        if html is None:
+            html = get_html(url)
+            self.put(url, html)
+        return html
@@ -13,7 +13,9 @@ import logging
 import os
 import random
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urlparse
 from urllib.robotparser import RobotFileParser
 
@@ -26,6 +28,12 @@ _RATE_LIMITER_CONTAINER: dict[str, DomainRateLimiter | None] = {"instance": None
 
 _LOG = logging.getLogger(__name__)
 
+# Per-thread session for get_html calls that don't pass one, so repeated
+# fetches reuse pooled keep-alive connections instead of reconnecting (and
+# redoing the TLS handshake) every time. requests.Session is not documented
+# as thread-safe, hence one per thread.
+_local = threading.local()
+
 # Cache for robots.txt parsers (domain -> RobotFileParser | None)
 # None indicates robots.txt fetch failed, assume allowed
 _ROBOTS_CACHE: dict[str, RobotFileParser | None] = {}
@@ -80,6 +88,15 @@ def get_rate_limiter() -> DomainRateLimiter:
     return limiter
 
 
+def _default_session() -> requests.Session:
+    """Return this thread's shared session, creating it on first use."""
+    session: requests.Session | None = getattr(_local, "session", None)
+    if session is None:
+        session = requests.Session()
+        _local.session = session
+    return session
+
+
 def _check_robots_txt(url: str, user_agent: str) -> bool:
     """
     Check if URL is allowed by robots.txt.
@@ -281,12 +298,12 @@ def get_html(
     # Build realistic browser headers
     headers = _build_browser_headers(url, user_agent=ua)
 
-    # Use provided session or create new one
-    http_client = session or requests.Session()
-    # Optional proxy override via PROXY_URL (requests also honors *_PROXY)
+    # Use provided session or this thread's shared one
+    http_client = session or _default_session()
+    # Optional proxy override via PROXY_URL (requests also honors *_PROXY).
+    # Passed per request so the shared session never keeps a stale proxy.
     proxy_url = os.environ.get("PROXY_URL")
-    if proxy_url:
-        http_client.proxies.update({"http": proxy_url, "https": proxy_url})
+    proxies = {"http": proxy_url, "https": proxy_url} if proxy_url else None
 
     limiter = get_rate_limiter()
 
@@ -301,7 +318,7 @@ def get_html(
             time.sleep(random.uniform(0, 0.2))
 
         try:
-            response = http_client.get(url, headers=headers, timeout=timeout)
+            response = http_client.get(url, headers=headers, timeout=timeout, proxies=proxies)
             response.raise_for_status()
 
             # Optional content size guard
@@ -427,6 +444,54 @@ def get_html(
     raise RuntimeError("Unexpected end of retry loop")
 
 
+def get_html_many(
+    urls: list[str],
+    *,
+    ua: str | None = None,
+    timeout: int = 30,
+    max_retries: int = 3,
+    respect_robots: bool = True,
+    max_workers: int = 8,
+) -> list[str | Exception]:
+    """
+    Fetch several URLs concurrently with get_html().
+
+    Each URL is fetched on a worker thread, so one domain's rate-limit
+    sleep or slow response no longer holds up requests to other domains.
+    Requests to the same domain still queue on that domain's token bucket.
+
+    Args:
+        urls: URLs to fetch
+        ua: Custom User-Agent (None = random from pool)
+        timeout: Request timeout in seconds
+        max_retries: Max retry attempts per URL
+        respect_robots: Check robots.txt before fetching
+        max_workers: Maximum number of concurrent fetches
+
+    Returns:
+        One entry per URL, in input order: the HTML, or the exception
+        get_html() raised for that URL
+    """
+
+    def fetch(url: str) -> str:
+        return get_html(
+            url, ua=ua, timeout=timeout, max_retries=max_retries, respect_robots=respect_robots
+        )
+
+    results: list[str | Exception] = []
+    if not urls:
+        return results
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(urls))) as executor:
+        futures = [executor.submit(fetch, url) for url in urls]
+        for future in futures:
+            try:
+                results.append(future.result())
+            except Exception as e:
+                results.append(e)
+    return results
+
+
 def create_session() -> requests.Session:
     """
     Create a requests.Session with persistent cookies and realistic settings.
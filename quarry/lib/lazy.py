@@ -0,0 +1,40 @@
+"""Lazy package re-exports (PEP 562)."""
+
+import importlib
+import sys
+from collections.abc import Callable
+from typing import Any
+
+
+def lazy_module_attrs(
+    package: str, attrs: dict[str, str]
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """
+    Build module-level ``__getattr__`` and ``__dir__`` for lazy re-exports.
+
+    Each name in attrs is imported from its module the first time it is
+    looked up on the package, then stored in the package namespace so
+    later lookups skip ``__getattr__`` entirely.
+
+    Args:
+        package: The package's ``__name__``
+        attrs: Exported name -> module path (relative paths resolve
+            against package)
+
+    Returns:
+        ``(__getattr__, __dir__)`` to assign in the package ``__init__``
+    """
+    namespace = sys.modules[package].__dict__
+
+    def __getattr__(name: str) -> Any:
+        module_name = attrs.get(name)
+        if module_name is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module_name, package), name)
+        namespace[name] = value
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted([*namespace, *attrs])
+
+    return __getattr__, __dir__
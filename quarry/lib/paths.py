@@ -136,6 +136,24 @@ def default_robots_cache_path(create_dirs: bool = True) -> Path:
     return path
 
 
+def default_scout_cache_path(create_dirs: bool = True) -> Path:
+    """Return the default SQLite path for cached scout analyses."""
+    directory = get_cache_dir(create=create_dirs)
+    path = directory / "scout.sqlite"
+    if create_dirs:
+        ensure_parent_dir(path)
+    return path
+
+
+def default_html_cache_path(create_dirs: bool = True) -> Path:
+    """Return the default SQLite path for cached page HTML."""
+    directory = get_cache_dir(create=create_dirs)
+    path = directory / "html.sqlite"
+    if create_dirs:
+        ensure_parent_dir(path)
+    return path
+
+
 def default_sink_path_template(extension: str = "parquet", create_dirs: bool = True) -> str:
     """Return the default sink template path for batch jobs."""
     ext = extension.lstrip(".")
@@ -6,6 +6,13 @@ from typing import Any
 import yaml
 from pydantic import BaseModel, Field, field_validator
 
+try:
+    from yaml import CSafeDumper as _YamlDumper
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - PyYAML built without libyaml
+    from yaml import SafeDumper as _YamlDumper  # type: ignore[assignment]
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
 
 class FieldSchema(BaseModel):
     """Schema for a single field in extraction."""
@@ -100,7 +107,7 @@ def load_schema(path: str | Path) -> ExtractionSchema:
 
     try:
         with path.open() as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=_YamlLoader)
     except yaml.YAMLError as e:
         raise ValueError(f"Invalid YAML: {e}") from e
 
@@ -134,6 +141,7 @@ def save_schema(schema: ExtractionSchema, path: str | Path) -> None:
         yaml.dump(
             data,
             f,
+            Dumper=_YamlDumper,
             default_flow_style=False,
             sort_keys=False,
             allow_unicode=True,
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
 from typing import Any, Literal, cast
 
@@ -11,7 +12,8 @@ from rich.console import Console
 from rich.panel import Panel
 
 from quarry.lib import paths
-from quarry.lib.http import get_html
+from quarry.lib.analysis_cache import AnalysisCache
+from quarry.lib.html_cache import HtmlCache
 from quarry.lib.schemas import load_schema, save_schema
 from quarry.lib.session import (
     get_last_analysis,
@@ -22,23 +24,28 @@ from quarry.lib.session import (
     set_last_schema,
 )
 from quarry.lib.theme import COLORS, QUARRY_THEME, QUESTIONARY_STYLE
-from quarry.tools.excavate.executor import ExcavateExecutor, write_jsonl
-from quarry.tools.polish.processor import PolishProcessor
-from quarry.tools.scout.analyzer import analyze_page
-from quarry.tools.ship.base import ExporterFactory
-from quarry.tools.survey.builder import build_schema_interactive
 
 console = Console(theme=QUARRY_THEME)
 
 # Questionary style using Mars/Jupiter palette
 q_style = QStyle.from_dict(QUESTIONARY_STYLE)
 
+QUICK_ENV_VAR = "QUARRY_MINER_QUICK"
+
+# Schema fields offered as the polish dedupe key, most specific first
+_DEDUPE_KEY_CANDIDATES = ("id", "link", "url", "slug")
+
 
 def _auto_paths_enabled() -> bool:
     """Return True when QUARRY_OUTPUT_DIR should drive path defaults."""
     return paths.auto_path_mode_enabled()
 
 
+def _quick_mode_enabled() -> bool:
+    """Return True when QUARRY_MINER_QUICK says to accept schema defaults unasked."""
+    return os.environ.get(QUICK_ENV_VAR) == "1"
+
+
 def _notify_auto_destination(action: str, target: Path) -> None:
     """Show a short message explaining where automated outputs go."""
     target_display = str(target)
@@ -105,6 +112,11 @@ def _run_miner() -> None:
 
 
 def _create_schema_flow() -> str | None:
+    # Each step imports its tool when it runs, so the first prompt does not
+    # wait on the whole pipeline (bs4, pydantic builders, exporters, ...)
+    from quarry.tools.scout.analyzer import analyze_page  # noqa: PLC0415
+    from quarry.tools.survey.builder import build_schema_interactive  # noqa: PLC0415
+
     url = questionary.text("Target URL (optional)", default="").ask()
     html_path = questionary.path("Local HTML file (optional)", default="").ask()
     html_content: str | None = None
@@ -119,19 +131,26 @@ def _create_schema_flow() -> str | None:
     elif url:
         try:
             console.print("[dim]Running Scout analysis...[/dim]")
-            html_content = get_html(url)
+            # Re-entering the flow for the same URL reuses the page for an hour
+            html_content = HtmlCache().fetch(url)
         except Exception as err:
             console.print(f"[{COLORS['error']}]Failed to fetch URL: {err}[/{COLORS['error']}]")
             html_content = None
 
     if html_content:
-        try:
-            analysis = analyze_page(html_content, url=url or None)
-        except Exception as err:
-            console.print(
-                f"[{COLORS['warning']}]Scout analysis failed: {err}[/{COLORS['warning']}]"
-            )
-            analysis = None
+        # Re-running the miner on an unchanged page reuses the Scout result
+        cache = AnalysisCache()
+        analysis = cache.get(html_content, url or None)
+        if analysis is None:
+            try:
+                analysis = analyze_page(html_content, url=url or None)
+            except Exception as err:
+                console.print(
+                    f"[{COLORS['warning']}]Scout analysis failed: {err}[/{COLORS['warning']}]"
+                )
+                analysis = None
+            else:
+                cache.put(html_content, url or None, analysis)
 
     if analysis:
         frameworks = analysis.get("frameworks") or []
@@ -205,6 +224,9 @@ def _create_schema_flow() -> str | None:
 
 
 def _run_extraction_flow(schema_path: str) -> str | None:
+    from quarry.tools.excavate.executor import ExcavateExecutor, write_jsonl  # noqa: PLC0415
+    from quarry.tools.polish.deduplicator import Deduplicator  # noqa: PLC0415
+
     try:
         schema = load_schema(schema_path)
     except Exception as err:
@@ -243,8 +265,15 @@ def _run_extraction_flow(schema_path: str) -> str | None:
     max_pages: int | None = None
 
     if use_pagination:
-        paginate = questionary.confirm("Follow pagination?", default=True).ask()
-        if paginate:
+        assert schema.pagination is not None
+        if schema.pagination.max_pages and _quick_mode_enabled():
+            # The schema already bounds the crawl, so skip both prompts
+            max_pages = schema.pagination.max_pages
+            console.print(
+                f"[{COLORS['info']}]Following pagination up to {max_pages} pages"
+                f" (set by {QUICK_ENV_VAR})[/{COLORS['info']}]"
+            )
+        elif questionary.confirm("Follow pagination?", default=True).ask():
             max_pages_answer = questionary.text(
                 "Maximum pages (blank = schema default)",
                 default="",
@@ -256,7 +285,6 @@ def _run_extraction_flow(schema_path: str) -> str | None:
                     warn = COLORS['warning']
                     console.print(f"[{warn}]Invalid number, using schema setting[/{warn}]")
             if not max_pages:
-                assert schema.pagination is not None
                 max_pages = schema.pagination.max_pages
         else:
             use_pagination = False
@@ -279,6 +307,19 @@ def _run_extraction_flow(schema_path: str) -> str | None:
 
     if not items:
         console.print(f"[{COLORS['warning']}]No items extracted[/{COLORS['warning']}]")
+    else:
+        # Overlapping pages repeat items; offer to drop exact repeats (ignoring
+        # _meta) before they are written instead of leaving them all to Polish
+        deduplicator = Deduplicator()
+        unique_items = [item for item in items if not deduplicator.is_duplicate(item)]
+        duplicate_count = len(items) - len(unique_items)
+        if (
+            duplicate_count
+            and questionary.confirm(
+                f"Drop {duplicate_count} exact duplicate item(s)?", default=True
+            ).ask()
+        ):
+            items = unique_items
 
     auto_paths = _auto_paths_enabled()
     schema_label = schema.name or Path(schema_path).stem
@@ -308,7 +349,7 @@ def _run_extraction_flow(schema_path: str) -> str | None:
     stats = executor.get_stats()
     ok = COLORS['success']
     console.print(
-        f"[{ok}]Saved {stats['items_extracted']} items from {stats['urls_fetched']} page(s) "
+        f"[{ok}]Saved {len(items)} items from {stats['urls_fetched']} page(s) "
         f"to {output_path}[/{ok}]",
     )
 
@@ -318,6 +359,8 @@ def _run_extraction_flow(schema_path: str) -> str | None:
 
 
 def _run_polish_flow(input_path: str) -> str | None:
+    from quarry.tools.polish.processor import PolishProcessor  # noqa: PLC0415
+
     processor = PolishProcessor()
 
     dedupe = questionary.confirm("Deduplicate records?", default=False).ask()
@@ -330,10 +373,9 @@ def _run_polish_flow(input_path: str) -> str | None:
         if last_schema and last_schema.get("path") and Path(last_schema["path"]).exists():
             try:
                 schema = load_schema(last_schema["path"])
-                for candidate in ("id", "link", "url", "slug"):
-                    if candidate in schema.fields:
-                        suggested_fields = [candidate]
-                        break
+                key_field = next((c for c in _DEDUPE_KEY_CANDIDATES if c in schema.fields), None)
+                if key_field:
+                    suggested_fields = [key_field]
             except Exception:  # pragma: no cover - advisory only
                 suggested_fields = []
 
@@ -403,6 +445,8 @@ def _run_polish_flow(input_path: str) -> str | None:
 
 
 def _run_export_flow(input_path: str) -> None:
+    from quarry.tools.ship.base import ExporterFactory  # noqa: PLC0415
+
     default_filename = Path(input_path).stem or "quarry_export"
     auto_paths = _auto_paths_enabled()
 
@@ -10,21 +10,14 @@ Tools:
   ship       Package and export data anywhere
 """
 
+import importlib
 import os
 import sys
 
 import click
-from rich.console import Console
 
-from quarry.core import load_yaml, run_job
 from quarry.lib.logging import setup_logging
 from quarry.lib.theme import COLORS, QUARRY_THEME
-from quarry.miner import run_miner
-from quarry.tools.excavate.cli import excavate as excavate_command
-from quarry.tools.polish.cli import polish as polish_command
-from quarry.tools.scout.cli import scout as scout_command
-from quarry.tools.ship.cli import ship as ship_command
-from quarry.tools.survey.cli import survey as survey_command
 
 # Mars/Jupiter themed banner
 BANNER = f"""
@@ -37,8 +30,37 @@ BANNER = f"""
 [{COLORS['dim']}]           Web Data Extraction Suite v2.0[/{COLORS['dim']}]
 """
 
+# Tool commands are imported on first use so each invocation only pays for
+# the dependencies (pandas, bs4, questionary, ...) of the tool it runs.
+LAZY_COMMANDS = {
+    "scout": "quarry.tools.scout.cli:scout",
+    "survey": "quarry.tools.survey.cli:survey",
+    "excavate": "quarry.tools.excavate.cli:excavate",
+    "polish": "quarry.tools.polish.cli:polish",
+    "ship": "quarry.tools.ship.cli:ship",
+    "foreman": "quarry.foreman:foreman",
+}
 
-@click.group(invoke_without_command=True)
+
+class LazyGroup(click.Group):
+    """Click group that imports subcommand modules only when they are looked up."""
+
+    def __init__(self, *args, lazy_commands: dict[str, str] | None = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_commands = lazy_commands or {}
+
+    def list_commands(self, ctx):
+        return sorted({*super().list_commands(ctx), *self.lazy_commands})
+
+    def get_command(self, ctx, cmd_name):
+        if cmd_name not in self.commands and cmd_name in self.lazy_commands:
+            module_name, attr = self.lazy_commands[cmd_name].split(":")
+            command = getattr(importlib.import_module(module_name), attr)
+            self.add_command(command, name=cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+
+@click.group(cls=LazyGroup, lazy_commands=LAZY_COMMANDS, invoke_without_command=True)
 @click.pass_context
 @click.version_option(version="2.0.8", prog_name="quarry")
 def quarry(ctx):
@@ -66,6 +88,8 @@ def quarry(ctx):
     # Initialize logging per env (non-disruptive to rich/click output)
     setup_logging()
     if ctx.invoked_subcommand is None:
+        from rich.console import Console  # noqa: PLC0415
+
         console = Console(theme=QUARRY_THEME)
         console.print(BANNER)
         console.print()
@@ -96,19 +120,6 @@ def quarry(ctx):
         ctx.exit()
 
 
-# Add tool commands
-quarry.add_command(scout_command, name="scout")
-quarry.add_command(survey_command, name="survey")
-quarry.add_command(excavate_command, name="excavate")
-quarry.add_command(polish_command, name="polish")
-quarry.add_command(ship_command, name="ship")
-
-# Add foreman guided tutorial
-from quarry.foreman import foreman as foreman_command  # noqa: E402
-
-quarry.add_command(foreman_command, name="foreman")
-
-
 @quarry.command()
 @click.argument("job_file", type=click.Path(exists=True))
 @click.option(
@@ -125,6 +136,7 @@ quarry.add_command(foreman_command, name="foreman")
 @click.option("--ignore-robots", is_flag=True, help="Ignore robots.txt (testing only)")
 def run(job_file, max_items, live, db_path, timezone, interactive, ignore_robots):
     """Execute a job YAML through the classic pipeline."""
+    from quarry.core import load_yaml, run_job  # noqa: PLC0415
 
     previous_interactive = os.environ.get("QUARRY_INTERACTIVE")
     previous_ignore = os.environ.get("QUARRY_IGNORE_ROBOTS")
@@ -192,6 +204,8 @@ def miner():
       quarry miner
       → Runs complete pipeline from schema to export
     """
+    from quarry.miner import run_miner  # noqa: PLC0415
+
     run_miner()
 
 
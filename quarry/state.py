@@ -1,75 +1,147 @@
 """SQLite state management for jobs and items."""
 
-import json
+import atexit
+import os
 import sqlite3
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
-from quarry.lib import paths
+from quarry.lib import fastjson, paths
 
 _DEFAULT_DB_PATH = str(paths.default_state_db_path())
+_UTC = timezone.utc
+
+# Per-thread cache of open connections keyed by database path. sqlite3
+# connections may not be shared across threads by default.
+_local = threading.local()
+
+_SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS jobs_state (
+    job TEXT PRIMARY KEY,
+    last_cursor TEXT,
+    last_run TEXT
+);
+CREATE TABLE IF NOT EXISTS items (
+    job TEXT,
+    id TEXT,
+    payload_json TEXT,
+    first_seen TEXT,
+    last_seen TEXT,
+    PRIMARY KEY (job, id)
+);
+CREATE TABLE IF NOT EXISTS failed_urls (
+    job TEXT,
+    url TEXT,
+    error_message TEXT,
+    retry_count INTEGER,
+    last_attempt TEXT,
+    PRIMARY KEY (job, url)
+);
+CREATE INDEX IF NOT EXISTS idx_items_job_last_seen ON items (job, last_seen);
+CREATE INDEX IF NOT EXISTS idx_failed_urls_job_last_attempt ON failed_urls (job, last_attempt);
+"""
+
+# Ids per "id IN (...)" lookup in upsert_items, below SQLite's historical
+# 999 bound-parameter limit (one parameter is the job)
+_ID_LOOKUP_CHUNK = 900
+
+# Database paths whose schema has been created by this process
+_initialized: set[str] = set()
 
 
 def open_db(path: str | None = None) -> sqlite3.Connection:
-    """Open or create SQLite database with proper schema."""
+    """Open or create SQLite database with proper schema.
+
+    Directory creation and schema DDL only run the first time this process
+    opens a path, or again if the database file has since been removed.
+    """
     db_path = path or _DEFAULT_DB_PATH
-    db_file = Path(db_path)
-    db_file.parent.mkdir(parents=True, exist_ok=True)
+    needs_schema = db_path not in _initialized or not os.path.exists(db_path)
+
+    if needs_schema:
+        parent = Path(db_path).parent
+        if not parent.exists():
+            parent.mkdir(parents=True, exist_ok=True)
 
     conn = sqlite3.connect(db_path)
     conn.row_factory = sqlite3.Row
+    if needs_schema:
+        # Only takes effect on a brand-new file, before the first table is created
+        conn.execute("PRAGMA page_size=8192")
+    conn.execute("PRAGMA cache_size=-65536")  # 64 MiB page cache
+
+    if needs_schema:
+        conn.executescript(_SCHEMA_SQL)
+        _initialized.add(db_path)
+    return conn
 
-    # Create tables
-    conn.execute(
-        """
-        CREATE TABLE IF NOT EXISTS jobs_state (
-            job TEXT PRIMARY KEY,
-            last_cursor TEXT,
-            last_run TEXT
-        )
-    """
-    )
-    conn.execute(
-        """
-        CREATE TABLE IF NOT EXISTS items (
-            job TEXT,
-            id TEXT,
-            payload_json TEXT,
-            first_seen TEXT,
-            last_seen TEXT,
-            PRIMARY KEY (job, id)
-        )
-    """
-    )
-    conn.execute(
-        """
-        CREATE TABLE IF NOT EXISTS failed_urls (
-            job TEXT,
-            url TEXT,
-            error_message TEXT,
-            retry_count INTEGER,
-            last_attempt TEXT,
-            PRIMARY KEY (job, url)
-        )
+
+@contextmanager
+def _write_transaction(conn: sqlite3.Connection) -> Iterator[sqlite3.Connection]:
+    """Run the block in a transaction that takes the write lock up front.
+
+    BEGIN IMMEDIATE makes concurrent writers queue on the lock once instead
+    of failing part-way with SQLITE_BUSY; the block is rolled back on error.
     """
-    )
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        yield conn
+    except BaseException:
+        conn.rollback()
+        raise
     conn.commit()
+
+
+def _utc_now() -> str:
+    """Current UTC time as an ISO 8601 string."""
+    return datetime.now(_UTC).isoformat()
+
+
+def _get_conn(path: str | None = None) -> sqlite3.Connection:
+    """Return this thread's cached connection for path, opening it if needed."""
+    db_path = path or _DEFAULT_DB_PATH
+    conns: dict[str, sqlite3.Connection] = _local.__dict__.setdefault("conns", {})
+    conn = conns.get(db_path)
+
+    # Reopen if the database file was removed behind our back
+    if conn is not None and db_path != ":memory:" and not os.path.exists(db_path):
+        conn.close()
+        conn = None
+
+    if conn is None:
+        conn = open_db(db_path)
+        conns[db_path] = conn
     return conn
 
 
+def close_db(path: str | None = None) -> None:
+    """Close cached connections for this thread (all of them if path is None)."""
+    conns: dict[str, sqlite3.Connection] = _local.__dict__.get("conns", {})
+    targets = list(conns) if path is None else [path]
+    for db_path in targets:
+        conn = conns.pop(db_path, None)
+        if conn is not None:
+            conn.close()
+
+
+atexit.register(close_db)
+
+
 def load_cursor(job: str, db_path: str | None = None) -> str | None:
     """Load the last cursor for a job."""
-    conn = open_db(db_path)
+    conn = _get_conn(db_path)
     cursor = conn.execute("SELECT last_cursor FROM jobs_state WHERE job = ?", (job,)).fetchone()
-    conn.close()
     return cursor["last_cursor"] if cursor and cursor["last_cursor"] else None
 
 
 def save_cursor(job: str, cursor: str | None, db_path: str | None = None) -> None:
     """Save or update the cursor for a job."""
-    conn = open_db(db_path)
-    now = datetime.now(timezone.utc).isoformat()
+    conn = _get_conn(db_path)
+    now = _utc_now()
     conn.execute(
         """
         INSERT INTO jobs_state (job, last_cursor, last_run)
@@ -81,7 +153,6 @@ def save_cursor(job: str, cursor: str | None, db_path: str | None = None) -> Non
         (job, cursor, now),
     )
     conn.commit()
-    conn.close()
 
 
 def upsert_items(job: str, records: list[dict[str, Any]], db_path: str | None = None) -> int:
@@ -91,47 +162,49 @@ def upsert_items(job: str, records: list[dict[str, Any]], db_path: str | None =
     Returns:
         Count of newly inserted rows (0 if all were updates).
     """
-    conn = open_db(db_path)
-    now = datetime.now(timezone.utc).isoformat()
-    new_count = 0
+    conn = _get_conn(db_path)
+    now = _utc_now()
 
+    # Payloads are stored as TEXT rather than raw bytes: SQLite 3.45+ reads
+    # BLOB arguments to its json_* functions as JSONB, so text JSON stored as
+    # a BLOB could no longer be queried in place.
+    rows = []
     for record in records:
         item_id = str(record.get("id", ""))
-        if not item_id:
-            continue
-
-        payload_json = json.dumps(record)
-
-        # Check if exists
-        existing = conn.execute(
-            "SELECT first_seen FROM items WHERE job = ? AND id = ?",
-            (job, item_id),
-        ).fetchone()
-
-        if existing:
-            # Update
-            conn.execute(
-                """
-                UPDATE items
-                SET payload_json = ?, last_seen = ?
-                WHERE job = ? AND id = ?
-            """,
-                (payload_json, now, job, item_id),
-            )
-        else:
-            # Insert
-            new_count += 1
-            conn.execute(
-                """
-                INSERT INTO items (job, id, payload_json, first_seen, last_seen)
-                VALUES (?, ?, ?, ?, ?)
-            """,
-                (job, item_id, payload_json, now, now),
+        if item_id:
+            rows.append((job, item_id, fastjson.dumps(record), now, now))
+
+    if not rows:
+        return 0
+
+    # Only this batch's ids are looked up (through the primary key), so the
+    # cost doesn't grow with the number of items the job already has.
+    # Holding the write lock keeps other writers out until the upsert lands.
+    batch_ids = list(dict.fromkeys(row[1] for row in rows))
+    with _write_transaction(conn):
+        existing: set[str] = set()
+        for start in range(0, len(batch_ids), _ID_LOOKUP_CHUNK):
+            chunk = batch_ids[start : start + _ID_LOOKUP_CHUNK]
+            placeholders = ",".join("?" * len(chunk))
+            existing.update(
+                row[0]
+                for row in conn.execute(
+                    f"SELECT id FROM items WHERE job = ? AND id IN ({placeholders})",
+                    (job, *chunk),
+                )
             )
-
-    conn.commit()
-    conn.close()
-    return new_count
+        # A single upsert keeps first_seen on conflict
+        conn.executemany(
+            """
+            INSERT INTO items (job, id, payload_json, first_seen, last_seen)
+            VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT(job, id) DO UPDATE SET
+                payload_json = excluded.payload_json,
+                last_seen = excluded.last_seen
+        """,
+            rows,
+        )
+    return len(batch_ids) - len(existing)
 
 
 def record_failed_url(job: str, url: str, error_message: str, db_path: str | None = None) -> None:
@@ -140,39 +213,21 @@ def record_failed_url(job: str, url: str, error_message: str, db_path: str | Non
 
     Increments retry_count if URL already failed before.
     """
-    conn = open_db(db_path)
-    now = datetime.now(timezone.utc).isoformat()
-
-    # Check if URL already failed
-    existing = conn.execute(
-        "SELECT retry_count FROM failed_urls WHERE job = ? AND url = ?",
-        (job, url),
-    ).fetchone()
-
-    if existing:
-        # Increment retry count
-        new_count = existing["retry_count"] + 1
-        conn.execute(
-            """
-            UPDATE failed_urls
-            SET error_message = ?, retry_count = ?, last_attempt = ?
-            WHERE job = ? AND url = ?
-        """,
-            (error_message, new_count, now, job, url),
-        )
-    else:
-        # First failure
+    conn = _get_conn(db_path)
+    now = _utc_now()
+    with _write_transaction(conn):
         conn.execute(
             """
             INSERT INTO failed_urls (job, url, error_message, retry_count, last_attempt)
-            VALUES (?, ?, ?, ?, ?)
+            VALUES (?, ?, ?, 1, ?)
+            ON CONFLICT(job, url) DO UPDATE SET
+                error_message = excluded.error_message,
+                retry_count = failed_urls.retry_count + 1,
+                last_attempt = excluded.last_attempt
         """,
-            (job, url, error_message, 1, now),
+            (job, url, error_message, now),
         )
 
-    conn.commit()
-    conn.close()
-
 
 def get_failed_urls(job: str, db_path: str | None = None) -> list[dict[str, Any]]:
     """
@@ -181,11 +236,10 @@ def get_failed_urls(job: str, db_path: str | None = None) -> list[dict[str, Any]
     Returns:
         List of dicts with keys: url, error_message, retry_count, last_attempt
     """
-    conn = open_db(db_path)
+    conn = _get_conn(db_path)
     rows = conn.execute(
         "SELECT url, error_message, retry_count, last_attempt FROM failed_urls WHERE job = ?",
         (job,),
     ).fetchall()
-    conn.close()
 
     return [dict(row) for row in rows]
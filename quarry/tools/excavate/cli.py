@@ -7,6 +7,7 @@ import click
 import questionary
 
 from quarry.lib import paths
+from quarry.lib.prompts import prompt_file
 from quarry.lib.schemas import load_schema
 from quarry.lib.session import get_last_schema, set_last_output
 
@@ -99,9 +100,7 @@ def excavate(schema_file, url, file, output, max_pages, no_metadata, pretty, bat
 
             # Prompt for schema file if not set
             if not schema_file:
-                schema_file = questionary.path(
-                    "Schema file:", validate=lambda x: Path(x).exists() or "File does not exist"
-                ).ask()
+                schema_file = prompt_file("Schema file:", allow_cancel=True)
 
                 if not schema_file:
                     click.echo("Cancelled", err=True)
@@ -151,9 +150,7 @@ def excavate(schema_file, url, file, output, max_pages, no_metadata, pretty, bat
             if not url:
                 sys.exit(0)
         elif source_type == "Local file":
-            file = questionary.path(
-                "HTML file path:", validate=lambda x: Path(x).exists() or "File does not exist"
-            ).ask()
+            file = prompt_file("HTML file path:", allow_cancel=True)
             if not file:
                 sys.exit(0)
         # else: Use schema URL (already set)
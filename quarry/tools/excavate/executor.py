@@ -1,6 +1,6 @@
 """Executor for running extraction at scale."""
 
-import json
+from collections.abc import Iterable
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -8,6 +8,7 @@ from urllib.parse import urljoin
 
 from bs4 import BeautifulSoup
 
+from quarry.lib import fastjson
 from quarry.lib.bs4_utils import attr_str
 from quarry.lib.http import get_html
 from quarry.lib.schemas import ExtractionSchema, load_schema
@@ -170,7 +171,9 @@ class ExcavateExecutor:
             # Fetch current page
             try:
                 html = get_html(current_url)
-                items = self.parser.parse(html)
+                # One parse serves both item extraction and the next-page lookup
+                soup = BeautifulSoup(html, "html.parser")
+                items = self.parser.parse_soup(soup)
 
                 # Add metadata
                 if include_metadata:
@@ -188,7 +191,7 @@ class ExcavateExecutor:
                 page_count += 1
 
                 # Find next page
-                next_url = self._find_next_page(html, current_url)
+                next_url = self._find_next_page(soup, current_url)
                 if next_url and next_url in seen_urls:
                     next_url = None
                 if next_url and next_url == current_url:
@@ -209,12 +212,12 @@ class ExcavateExecutor:
 
         return all_items
 
-    def _find_next_page(self, html: str, current_url: str) -> str | None:
+    def _find_next_page(self, soup: BeautifulSoup, current_url: str) -> str | None:
         """
-        Find next page URL from HTML.
+        Find next page URL in a parsed page.
 
         Args:
-            html: Current page HTML
+            soup: Current page, already parsed
             current_url: Current page URL (for making absolute URLs)
 
         Returns:
@@ -223,8 +226,6 @@ class ExcavateExecutor:
         if not self.schema.pagination:
             return None
 
-        soup = BeautifulSoup(html, "html.parser")
-
         try:
             next_link = soup.select_one(self.schema.pagination.next_selector)
 
@@ -250,12 +251,12 @@ class ExcavateExecutor:
         return self.stats.copy()
 
 
-def write_jsonl(items: list[dict[str, Any]], output_path: str | Path) -> int:
+def write_jsonl(items: Iterable[dict[str, Any]], output_path: str | Path) -> int:
     """
     Write items to JSONL file.
 
     Args:
-        items: List of items to write
+        items: Items to write (any iterable; consumed once)
         output_path: Output file path
 
     Returns:
@@ -265,20 +266,20 @@ def write_jsonl(items: list[dict[str, Any]], output_path: str | Path) -> int:
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
     count = 0
-    with output_path.open("w", encoding="utf-8") as f:
+    with output_path.open("wb") as f:
         for item in items:
-            f.write(json.dumps(item, ensure_ascii=False) + "\n")
+            f.write(fastjson.dumps_line(item))
             count += 1
 
     return count
 
 
-def append_jsonl(items: list[dict[str, Any]], output_path: str | Path) -> int:
+def append_jsonl(items: Iterable[dict[str, Any]], output_path: str | Path) -> int:
     """
     Append items to JSONL file.
 
     Args:
-        items: List of items to append
+        items: Items to append (any iterable; consumed once)
         output_path: Output file path
 
     Returns:
@@ -288,9 +289,9 @@ def append_jsonl(items: list[dict[str, Any]], output_path: str | Path) -> int:
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
     count = 0
-    with output_path.open("a", encoding="utf-8") as f:
+    with output_path.open("ab") as f:
         for item in items:
-            f.write(json.dumps(item, ensure_ascii=False) + "\n")
+            f.write(fastjson.dumps_line(item))
             count += 1
 
     return count
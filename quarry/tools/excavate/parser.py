@@ -40,8 +40,21 @@ class SchemaParser:
         if not html or not html.strip():
             return []
 
-        soup = BeautifulSoup(html, "html.parser")
+        return self.parse_soup(BeautifulSoup(html, "html.parser"))
 
+    def parse_soup(self, soup: BeautifulSoup) -> list[dict[str, Any]]:
+        """
+        Extract items from an already-parsed document.
+
+        Lets callers that also need the tree for something else, such as
+        following pagination, parse each page only once.
+
+        Args:
+            soup: Parsed HTML document
+
+        Returns:
+            List of extracted items (dicts)
+        """
         # Find all item containers
         try:
             item_elements = select_list(soup, self.schema.item_selector)
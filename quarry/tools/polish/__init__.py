@@ -1,13 +1,32 @@
 """Polish - Data transformation and enrichment tool."""
 
-from .deduplicator import Deduplicator
-from .transformers import (
-    clean_whitespace,
-    extract_domain,
-    normalize_text,
-    parse_date,
-)
-from .validators import ValidationError, validate_record
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from quarry.lib.lazy import lazy_module_attrs
+
+if TYPE_CHECKING:
+    from .deduplicator import Deduplicator
+    from .transformers import (
+        clean_whitespace,
+        extract_domain,
+        normalize_text,
+        parse_date,
+    )
+    from .validators import ValidationError, validate_record
+
+# Re-exports are loaded on first access (PEP 562) so importing one polish
+# submodule does not pull in the others.
+_LAZY_ATTRS = {
+    "Deduplicator": ".deduplicator",
+    "ValidationError": ".validators",
+    "clean_whitespace": ".transformers",
+    "extract_domain": ".transformers",
+    "normalize_text": ".transformers",
+    "parse_date": ".transformers",
+    "validate_record": ".validators",
+}
 
 __all__ = [
     "Deduplicator",
@@ -18,3 +37,6 @@ __all__ = [
     "parse_date",
     "validate_record",
 ]
+
+
+__getattr__, __dir__ = lazy_module_attrs(__name__, _LAZY_ATTRS)
@@ -1,17 +1,44 @@
 """CLI for Polish tool."""
 
+import mmap
+import os
 import sys
 from pathlib import Path
 from typing import Any, Literal, cast
 
 import click
-import questionary
 
-from quarry.lib import paths
+from quarry.lib import fastjson, paths
 from quarry.lib.session import get_last_output, set_last_output
 
 from .processor import PolishProcessor
 
+# How much of the input to map when sniffing the first record's fields
+_SNIFF_WINDOW = 64 * 1024
+
+
+def _read_first_line(path: str | Path) -> bytes:
+    """
+    Return the first line of a file without setting up buffered I/O.
+
+    Maps at most _SNIFF_WINDOW bytes and slices up to the first newline;
+    a longer first line falls back to readline(), so the result may keep
+    its trailing newline.
+    """
+    with open(path, "rb", buffering=0) as f:
+        size = min(_SNIFF_WINDOW, os.fstat(f.fileno()).st_size)
+        if size == 0:
+            return b""
+        with mmap.mmap(f.fileno(), size, access=mmap.ACCESS_READ) as mm:
+            end = mm.find(b"\n")
+            if end >= 0:
+                return mm[:end]
+            if size < _SNIFF_WINDOW:
+                return mm[:]
+
+    with open(path, "rb") as f:
+        return f.readline()
+
 
 @click.command()
 @click.argument("input_file", type=click.Path(exists=True), required=False)
@@ -158,6 +185,12 @@ def polish(
     if not batch_mode and not input_file:
         click.echo("✨ Quarry Polish - Interactive Mode\n", err=True)
 
+        # questionary pulls in prompt_toolkit (~100 ms); load it only for
+        # interactive runs, and after the banner so the terminal responds first
+        import questionary
+
+        from quarry.lib.prompts import prompt_file
+
         try:
             # Check if there's output from a previous tool invocation
             last_output = get_last_output()
@@ -176,10 +209,7 @@ def polish(
 
             # Prompt for input file if not set
             if not input_file:
-                input_file = questionary.path(
-                    "Input file (JSONL):",
-                    validate=lambda x: Path(x).exists() or "File does not exist",
-                ).ask()
+                input_file = prompt_file("Input file (JSONL):", allow_cancel=True)
 
                 if not input_file:
                     click.echo("Cancelled", err=True)
@@ -222,14 +252,11 @@ def polish(
         # Try to read field names from the input file for better UX
         available_fields: list[str] = []
         try:
-            import json
-
-            with open(input_file, encoding="utf-8") as f:
-                first_line = f.readline().strip()
-                if first_line:
-                    sample = json.loads(first_line)
-                    # Exclude _meta field from suggestions
-                    available_fields = [k for k in sample.keys() if not k.startswith("_")]
+            first_line = _read_first_line(input_file).strip()
+            if first_line:
+                sample = fastjson.loads(first_line)
+                # Exclude _meta field from suggestions
+                available_fields = [k for k in sample.keys() if not k.startswith("_")]
         except Exception:
             pass  # Fall back to manual entry
 
@@ -251,19 +278,19 @@ def polish(
                         "Select fields for deduplication:",
                         choices=available_fields,
                     ).ask()
-                    dedupe_keys = tuple(selected_keys) if selected_keys else ()
+                    dedupe_keys = selected_keys or []
                 elif dedupe_choice == "all":
-                    dedupe_keys = ()
+                    dedupe_keys = []
                 else:  # manual
                     dedupe_keys_input = questionary.text(
                         "Dedupe keys (space-separated):", default=""
                     ).ask()
-                    dedupe_keys = tuple(dedupe_keys_input.split()) if dedupe_keys_input else ()
+                    dedupe_keys = (dedupe_keys_input or "").split()
             else:
                 dedupe_keys_input = questionary.text(
                     "Dedupe keys (space-separated, or leave empty for all fields):", default=""
                 ).ask()
-                dedupe_keys = tuple(dedupe_keys_input.split()) if dedupe_keys_input else ()
+                dedupe_keys = (dedupe_keys_input or "").split()
 
             # Ask for strategy
             dedupe_strategy = (
@@ -471,8 +498,9 @@ def polish(
                 transformations[field] = []
             transformations[field].append({"transform": transform_name})
 
-    # Convert dedupe_keys tuple to list
-    dedupe_key_list = list(dedupe_keys) if dedupe_keys else None
+    # dedupe_keys is click's tuple or a prompt's list; the processor takes a
+    # list, and None (never an empty list) means full-record comparison
+    dedupe_key_list = list(dedupe_keys) or None
 
     # Create processor
     processor = PolishProcessor()
@@ -4,6 +4,10 @@ import hashlib
 import json
 from typing import Any, Literal
 
+# Reused for every record: json.dumps() with non-default options builds a
+# fresh encoder per call.
+_KEY_ENCODER = json.JSONEncoder(sort_keys=True, default=str)
+
 
 class Deduplicator:
     """
@@ -30,12 +34,12 @@ class Deduplicator:
         """
         self.key_fields = key_fields
         self.strategy = strategy
-        self.seen_hashes: set[str] = set()
-        self.last_records: dict[str, dict[str, Any]] = {}
+        self.seen_hashes: set[int] = set()
+        self.last_records: dict[int, dict[str, Any]] = {}
         self.processed_count = 0
         self.duplicate_count = 0
 
-    def _compute_hash(self, record: dict[str, Any]) -> str:
+    def _compute_hash(self, record: dict[str, Any]) -> int:
         """
         Compute hash for a record.
 
@@ -43,7 +47,7 @@ class Deduplicator:
             record: Record dictionary
 
         Returns:
-            SHA256 hash string
+            First 128 bits of the SHA256 digest as an integer
         """
         if self.key_fields:
             # Hash only specified fields
@@ -53,8 +57,8 @@ class Deduplicator:
             key_data = {k: v for k, v in record.items() if k != "_meta"}
 
         # Create stable JSON representation
-        json_str = json.dumps(key_data, sort_keys=True, default=str)
-        return hashlib.sha256(json_str.encode()).hexdigest()
+        json_str = _KEY_ENCODER.encode(key_data)
+        return int.from_bytes(hashlib.sha256(json_str.encode()).digest()[:16], "big")
 
     def is_duplicate(self, record: dict[str, Any]) -> bool:
         """
@@ -1,14 +1,21 @@
 """Polish processor - orchestrates data transformation and enrichment."""
 
 import json
-from collections.abc import Callable
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import ExitStack
+from functools import partial
 from pathlib import Path
 from typing import Any, Literal
 
+from quarry.lib import fastjson
+
 from .deduplicator import Deduplicator
-from .transformers import apply_transformation
+from .transformers import apply_batch, get_transformation, supports_batch
 from .validators import validate_record
 
+# One resolved transformation: (name, function, extra kwargs)
+_TransformStep = tuple[str, Callable[..., Any], dict[str, Any]]
+
 
 class PolishProcessor:
     """
@@ -17,6 +24,13 @@ class PolishProcessor:
     Implements streaming JSONL → JSONL transformation pipeline.
     """
 
+    # Records decoded per chunk; transformations run column-wise per chunk.
+    BATCH_SIZE = 10_000
+
+    # Input is read as bytes through a large buffer and handed to the JSON
+    # parser without decoding to str first.
+    READ_BUFFER_SIZE = 1 << 20
+
     def __init__(self):
         """Initialize processor."""
         self.stats = {
@@ -69,22 +83,29 @@ class PolishProcessor:
                 strategy=dedupe_strategy,
             )
 
-        # Process records
-        records_to_write = []
+        # Resolve transformation names and kwargs once for the whole run
+        plan = self._compile_transformations(transformations) if transformations else []
 
-        with input_path.open("r", encoding="utf-8") as f:
-            for line in f:
-                if not line.strip():
-                    continue
+        # Records are written as soon as they pass. Keep-last dedupe holds its
+        # records in the deduplicator, and rewriting the input file in place
+        # has to finish reading before the output is opened.
+        keep_last = deduplicator is not None and dedupe_strategy == "last"
+        in_place = output_path.exists() and output_path.resolve() == input_path.resolve()
+        records_to_write: list[dict[str, Any]] = []
 
-                try:
-                    record = json.loads(line)
-                    self.stats["records_read"] += 1
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        with ExitStack() as stack:
+            f = stack.enter_context(input_path.open("rb", buffering=self.READ_BUFFER_SIZE))
+            out = None
+            if not (keep_last or in_place):
+                out = stack.enter_context(output_path.open("w", encoding="utf-8"))
 
-                    # Apply transformations
-                    if transformations:
-                        record = self._apply_transformations(record, transformations)
+            for batch in self._read_batches(f):
+                # Apply transformations
+                if plan:
+                    self._apply_transformations_batch(batch, plan)
 
+                for record in batch:
                     # Apply filter
                     if filter_func and not filter_func(record):
                         self.stats["records_skipped"] += 1
@@ -101,70 +122,145 @@ class PolishProcessor:
 
                     # Check for duplicates
                     if deduplicator:
-                        if dedupe_strategy == "first":
-                            if deduplicator.is_duplicate(record):
-                                self.stats["duplicates_removed"] += 1
-                                continue
-                        else:
-                            # For "last" strategy, collect all records
+                        if keep_last:
+                            # The deduplicator keeps the last record per key
                             deduplicator.is_duplicate(record)
+                            continue
+                        if deduplicator.is_duplicate(record):
+                            self.stats["duplicates_removed"] += 1
+                            continue
 
-                    records_to_write.append(record)
-
-                except json.JSONDecodeError:
-                    self.stats["records_skipped"] += 1
-                    continue
+                    if out is None:
+                        records_to_write.append(record)
+                    else:
+                        out.write(json.dumps(record) + "\n")
+                        self.stats["records_written"] += 1
 
         # Handle "last" deduplication strategy
-        if deduplicator and dedupe_strategy == "last":
-            unique_records = deduplicator.get_unique_records()
-            self.stats["duplicates_removed"] = self.stats["records_read"] - len(unique_records)
-            records_to_write = unique_records
+        if deduplicator and keep_last:
+            records_to_write = deduplicator.get_unique_records()
+            self.stats["duplicates_removed"] = self.stats["records_read"] - len(records_to_write)
 
-        # Write output
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        with output_path.open("w", encoding="utf-8") as f:
-            for record in records_to_write:
-                f.write(json.dumps(record) + "\n")
-                self.stats["records_written"] += 1
+        if keep_last or in_place:
+            with output_path.open("w", encoding="utf-8") as out:
+                for record in records_to_write:
+                    out.write(json.dumps(record) + "\n")
+                    self.stats["records_written"] += 1
 
         return self.stats
 
-    def _apply_transformations(
+    def _read_batches(self, lines: Iterable[bytes]) -> Iterator[list[dict[str, Any]]]:
+        """
+        Decode JSONL lines into lists of at most BATCH_SIZE records.
+
+        Blank lines are ignored and undecodable lines are counted as skipped.
+        """
+        batch: list[dict[str, Any]] = []
+        for line in lines:
+            if not line.strip():
+                continue
+
+            try:
+                record = fastjson.loads(line)
+            except json.JSONDecodeError:
+                self.stats["records_skipped"] += 1
+                continue
+
+            self.stats["records_read"] += 1
+            batch.append(record)
+            if len(batch) >= self.BATCH_SIZE:
+                yield batch
+                batch = []
+
+        if batch:
+            yield batch
+
+    def _compile_transformations(
         self,
-        record: dict[str, Any],
         transformations: dict[str, list[dict[str, Any]]],
-    ) -> dict[str, Any]:
+    ) -> list[tuple[str, list[_TransformStep]]]:
         """
-        Apply transformations to record fields.
+        Resolve field transformation definitions into callables.
+
+        Unknown transformation names are dropped: applying them would fail on
+        every value and leave it unchanged anyway.
 
         Args:
-            record: Input record
             transformations: Field transformation definitions
 
         Returns:
-            Transformed record
+            (field, steps) pairs in definition order
         """
+        plan = []
         for field, transforms in transformations.items():
-            if field not in record:
-                continue
-
-            value = record[field]
-
+            steps: list[_TransformStep] = []
             for transform_def in transforms:
                 transform_name = transform_def.get("transform")
                 if not transform_name:
                     continue
 
+                try:
+                    func = get_transformation(transform_name)
+                except ValueError:
+                    continue
+
                 # Get additional kwargs
                 kwargs = {k: v for k, v in transform_def.items() if k != "transform"}
+                steps.append((transform_name, func, kwargs))
 
-                try:
-                    value = apply_transformation(value, transform_name, **kwargs)
-                except Exception:
-                    # Transformation failed, keep original value
-                    pass
+            if steps:
+                plan.append((field, steps))
+        return plan
+
+    def _apply_transformations_batch(
+        self,
+        records: list[dict[str, Any]],
+        plan: list[tuple[str, list[_TransformStep]]],
+    ) -> None:
+        """
+        Apply transformations to a batch of records in place, one field at a time.
+
+        Transformations run in the order given for each field; string transforms
+        with a vectorized kernel are applied to the whole column at once.
+
+        Args:
+            records: Decoded records
+            plan: Resolved transformations from _compile_transformations
+        """
+        for field, steps in plan:
+            targets = [record for record in records if field in record]
+            if not targets:
+                continue
+
+            values = [record[field] for record in targets]
+            for step in steps:
+                values = self._transform_column(values, step)
+
+            for record, value in zip(targets, values, strict=True):
+                record[field] = value
+
+    def _transform_column(self, values: list[Any], step: _TransformStep) -> list[Any]:
+        """Apply one transformation to a column of values, keeping originals on error."""
+        transform_name, func, kwargs = step
+
+        if supports_batch(transform_name):
+            import pyarrow as pa
 
-            record[field] = value
+            try:
+                column = pa.array(values, type=pa.string())
+                transformed: list[Any] = apply_batch(column, transform_name, **kwargs).to_pylist()
+                return transformed
+            except Exception:
+                # Non-string values or bad kwargs: fall through to per-value
+                pass
 
-        return record
+        call = partial(func, **kwargs) if kwargs else func
+        result = []
+        for value in values:
+            try:
+                value = call(value)
+            except Exception:
+                # Transformation failed, keep original value
+                pass
+            result.append(value)
+        return result
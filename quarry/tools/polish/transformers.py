@@ -3,11 +3,39 @@
 import re
 from collections.abc import Callable
 from datetime import datetime
-from typing import Any
-from urllib.parse import urlparse
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
+from urllib.parse import urljoin, urlparse
 
-# Custom transform registry
-_CUSTOM_TRANSFORMS: dict[str, Callable[..., Any]] = {}
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+_HTML_TAG_RE = re.compile(r"<[^>]+>")
+
+# Byte values deleted by extract_number's ASCII fast path, and the regex it
+# uses for non-ASCII input.
+_NON_NUMERIC_ASCII = bytes(b for b in range(128) if chr(b) not in "0123456789.-")
+_NON_NUMERIC_RE = re.compile(r"[^0-9.-]")
+
+# Strings recognized by to_boolean (after lowercasing and stripping)
+_TRUE_VALUES = frozenset({"yes", "true", "y", "1", "on", "t"})
+_FALSE_VALUES = frozenset({"no", "false", "n", "0", "off", "f"})
+
+# Characters that make urlparse rewrite or validate a URL before splitting it.
+_URL_SLOW_PATH_RE = re.compile(r"[\t\n\r\[\]]")
+
+# Default parse_date formats grouped by a separator every match must contain
+# (strptime only accepts full matches). The first group whose separator is
+# present holds the only formats that can match, in the order they were
+# always tried, so "01/02/2024" still reads month-first. The "" group catches
+# "15 January 2024"-style dates, which contain none of the other separators.
+_DEFAULT_DATE_FORMAT_GROUPS: tuple[tuple[str, tuple[str, ...]], ...] = (
+    ("/", ("%m/%d/%Y", "%d/%m/%Y", "%Y/%m/%d")),
+    (",", ("%B %d, %Y", "%b %d, %Y")),
+    (":", ("%Y-%m-%dT%H:%M:%S", "%Y-%m-%d %H:%M:%S")),
+    ("-", ("%Y-%m-%d",)),
+    ("", ("%d %B %Y", "%d %b %Y")),
+)
 
 
 def register_transform(name: str):
@@ -32,12 +60,23 @@ def register_transform(name: str):
     """
 
     def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
-        _CUSTOM_TRANSFORMS[name] = func
+        _DISPATCH[name] = func
         return func
 
     return decorator
 
 
+def _is_collapsed(text: str) -> bool:
+    """
+    Return True if " ".join(text.split()) would give back text unchanged.
+
+    Every whitespace character other than the ASCII space is non-printable,
+    so printable text with no leading, trailing or doubled spaces is already
+    collapsed. Checking that avoids building the split list for clean input.
+    """
+    return text.isprintable() and text[:1] not in ("", " ") and text[-1] != " " and "  " not in text
+
+
 def normalize_text(text: str | None) -> str | None:
     """
     Normalize text by removing extra whitespace and standardizing.
@@ -55,6 +94,9 @@ def normalize_text(text: str | None) -> str | None:
     if text is None or not isinstance(text, str):
         return text
 
+    if _is_collapsed(text):
+        return text
+
     # Strip and collapse whitespace
     normalized = " ".join(text.split())
     return normalized if normalized else None
@@ -73,6 +115,9 @@ def clean_whitespace(text: str | None) -> str | None:
     if text is None or not isinstance(text, str):
         return text
 
+    if _is_collapsed(text):
+        return text
+
     # Remove leading/trailing whitespace and collapse internal
     cleaned = " ".join(text.split())
     return cleaned if cleaned else None
@@ -97,24 +142,22 @@ def parse_date(
     if date_str is None or not isinstance(date_str, str):
         return None
 
+    date_str = date_str.strip()
+
     if formats is None:
-        formats = [
-            "%Y-%m-%d",
-            "%m/%d/%Y",
-            "%d/%m/%Y",
-            "%Y/%m/%d",
-            "%B %d, %Y",
-            "%b %d, %Y",
-            "%d %B %Y",
-            "%d %b %Y",
-            "%Y-%m-%dT%H:%M:%S",
-            "%Y-%m-%d %H:%M:%S",
-        ]
+        iso_date = _parse_iso_date(date_str)
+        if iso_date is not None:
+            return iso_date
+
+        for separator, group in _DEFAULT_DATE_FORMAT_GROUPS:
+            if separator in date_str:
+                formats = list(group)
+                break
 
     # Try each format
-    for fmt in formats:
+    for fmt in formats or ():
         try:
-            dt = datetime.strptime(date_str.strip(), fmt)
+            dt = datetime.strptime(date_str, fmt)
             return dt.strftime("%Y-%m-%d")
         except ValueError:
             continue
@@ -122,6 +165,27 @@ def parse_date(
     return None
 
 
+def _parse_iso_date(date_str: str) -> str | None:
+    """
+    Parse YYYY-MM-DD and YYYY-MM-DD[T ]HH:MM:SS with datetime.fromisoformat.
+
+    Only these exact shapes are accepted, where fromisoformat and the
+    equivalent default strptime formats agree; anything else returns None and
+    goes through strptime.
+    """
+    if len(date_str) not in (10, 19) or date_str[4] != "-" or date_str[7] != "-":
+        return None
+    if len(date_str) == 19 and not (
+        date_str[10] in "T " and date_str[13] == ":" and date_str[16] == ":"
+    ):
+        return None
+
+    try:
+        return datetime.fromisoformat(date_str).strftime("%Y-%m-%d")
+    except ValueError:
+        return None
+
+
 def extract_domain(url: str | None) -> str | None:
     """
     Extract domain from URL.
@@ -135,22 +199,46 @@ def extract_domain(url: str | None) -> str | None:
     if url is None or not isinstance(url, str):
         return None
 
-    try:
+    # The host is everything between the scheme and the first "/", "?" or "#",
+    # exactly as urlparse computes netloc. Scan for it directly and only fall
+    # back to urlparse for inputs it would rewrite or validate (embedded
+    # tabs/newlines, IPv6 brackets, non-ASCII hosts).
+    if url.startswith("https://"):
+        start = 8
+    elif url.startswith("http://"):
+        start = 7
+    else:
         # Handle relative URLs
-        if not url.startswith(("http://", "https://")):
-            url = "https://" + url
+        start = 0
 
-        parsed = urlparse(url)
-        domain = parsed.netloc
+    end = len(url)
+    for delimiter in "/?#":
+        index = url.find(delimiter, start, end)
+        if index >= 0:
+            end = index
+    domain = url[start:end]
 
-        # Remove www. prefix
-        if domain.startswith("www."):
-            domain = domain[4:]
+    if not domain.isascii() or _URL_SLOW_PATH_RE.search(url):
+        return _extract_domain_urlparse(url if start else "https://" + url)
 
-        return domain if domain else None
-    except Exception:
+    # Remove www. prefix
+    if domain.startswith("www."):
+        domain = domain[4:]
+
+    return domain if domain else None
+
+
+def _extract_domain_urlparse(url: str) -> str | None:
+    try:
+        domain = urlparse(url).netloc
+    except ValueError:
         return None
 
+    if domain.startswith("www."):
+        domain = domain[4:]
+
+    return domain if domain else None
+
 
 def truncate_text(text: str | None, max_length: int = 100) -> str | None:
     """
@@ -186,7 +274,7 @@ def remove_html_tags(text: str | None) -> str | None:
         return text
 
     # Simple regex to remove tags
-    clean = re.sub(r"<[^>]+>", "", text)
+    clean = _HTML_TAG_RE.sub("", text)
     return clean_whitespace(clean)
 
 
@@ -236,23 +324,23 @@ def extract_number(text: str | None) -> float | None:
     if text is None or not isinstance(text, str):
         return None
 
-    # First remove commas (thousand separators)
-    text = text.replace(",", "")
-
-    # Extract all digits, decimal point, and minus sign
-    cleaned = re.sub(r"[^0-9.-]", "", text)
+    # Keep only digits, decimal points and minus signs (this also drops
+    # thousands separators and currency symbols) in a single C-level pass
+    if text.isascii():
+        cleaned = text.encode("ascii").translate(None, _NON_NUMERIC_ASCII).decode("ascii")
+    else:
+        cleaned = _NON_NUMERIC_RE.sub("", text)
 
-    # Handle multiple decimals or minus signs
     if not cleaned:
         return None
 
     # Remove extra decimals (keep only the first one)
-    if cleaned.count(".") > 1:
-        parts = cleaned.split(".")
-        cleaned = parts[0] + "." + "".join(parts[1:])
+    head, dot, tail = cleaned.partition(".")
+    if dot and "." in tail:
+        cleaned = head + "." + tail.replace(".", "")
 
     # Handle multiple minus signs (keep only if at start)
-    if cleaned.count("-") > 0:
+    if "-" in cleaned:
         is_negative = cleaned[0] == "-"
         cleaned = cleaned.replace("-", "")
         if is_negative:
@@ -289,12 +377,10 @@ def to_boolean(value: str | bool | int | None) -> bool | None:
         return None
 
     normalized = value.lower().strip()
-    true_values = {"yes", "true", "y", "1", "on", "t"}
-    false_values = {"no", "false", "n", "0", "off", "f"}
 
-    if normalized in true_values:
+    if normalized in _TRUE_VALUES:
         return True
-    elif normalized in false_values:
+    elif normalized in _FALSE_VALUES:
         return False
     else:
         return None
@@ -342,14 +428,38 @@ def to_absolute_url(url: str | None, base_url: str) -> str | None:
     if url.startswith("http://") or url.startswith("https://"):
         return url
 
-    from urllib.parse import urljoin
-
     try:
-        return urljoin(base_url, url)
+        return _urljoin_cached(base_url, url)
     except Exception:
         return None
 
 
+# Pages repeat the same navigation/footer links, so identical (base, link)
+# pairs recur across records and urljoin's parse/resolve work can be reused.
+@lru_cache(maxsize=4096)
+def _urljoin_cached(base_url: str, url: str) -> str:
+    return urljoin(base_url, url)
+
+
+def get_transformation(transformation: str) -> Callable[..., Any]:
+    """
+    Look up the function registered for a transformation name.
+
+    Args:
+        transformation: Transformation name
+
+    Returns:
+        Transformation function
+
+    Raises:
+        ValueError: If no transformation is registered under that name
+    """
+    func = _DISPATCH.get(transformation)
+    if func is None:
+        raise ValueError(f"Unknown transformation: {transformation}")
+    return func
+
+
 def apply_transformation(
     value: Any,
     transformation: str,
@@ -366,30 +476,126 @@ def apply_transformation(
     Returns:
         Transformed value
     """
-    transformations: dict[str, Callable[..., Any]] = {
-        "normalize_text": normalize_text,
-        "clean_whitespace": clean_whitespace,
-        "clean_text": clean_whitespace,  # Alias for documentation compatibility
-        "parse_date": parse_date,
-        "extract_domain": extract_domain,
-        "extract_number": extract_number,
-        "truncate_text": truncate_text,
-        "remove_html_tags": remove_html_tags,
-        "strip_html": remove_html_tags,  # Alias
-        "uppercase": uppercase,
-        "to_uppercase": uppercase,  # Alias for documentation compatibility
-        "lowercase": lowercase,
-        "to_lowercase": lowercase,  # Alias for documentation compatibility
-        "to_boolean": to_boolean,
-        "round": round_number,
-        "to_absolute": to_absolute_url,
-    }
-
-    # Include custom registered transforms
-    transformations.update(_CUSTOM_TRANSFORMS)
-
-    func: Callable[..., Any] | None = transformations.get(transformation)
+    func = _DISPATCH.get(transformation)
     if func is None:
         raise ValueError(f"Unknown transformation: {transformation}")
 
+    if not kwargs:
+        return func(value)
     return func(value, **kwargs)
+
+
+# Name -> transform lookup used by apply_transformation. Built once at import;
+# register_transform adds custom entries (and may override built-ins).
+_DISPATCH: dict[str, Callable[..., Any]] = {
+    "normalize_text": normalize_text,
+    "clean_whitespace": clean_whitespace,
+    "clean_text": clean_whitespace,  # Alias for documentation compatibility
+    "parse_date": parse_date,
+    "extract_domain": extract_domain,
+    "extract_number": extract_number,
+    "truncate_text": truncate_text,
+    "remove_html_tags": remove_html_tags,
+    "strip_html": remove_html_tags,  # Alias
+    "uppercase": uppercase,
+    "to_uppercase": uppercase,  # Alias for documentation compatibility
+    "lowercase": lowercase,
+    "to_lowercase": lowercase,  # Alias for documentation compatibility
+    "to_boolean": to_boolean,
+    "round": round_number,
+    "to_absolute": to_absolute_url,
+}
+
+
+# ASCII characters str.split() treats as whitespace; the Arrow kernels below
+# only run on ASCII arrays, so this reproduces the scalar semantics exactly.
+_ASCII_WHITESPACE = "\t\n\x0b\x0c\r\x1c\x1d\x1e\x1f "
+_ASCII_WHITESPACE_RUN = r"[\t-\r\x1c-\x1f ]+"
+
+
+def _clean_whitespace_batch(values: "pa.Array") -> "pa.Array":
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    collapsed = pc.replace_substring_regex(values, _ASCII_WHITESPACE_RUN, " ")
+    trimmed = pc.utf8_trim(collapsed, characters=" ")
+    return pc.if_else(pc.equal(trimmed, ""), pa.scalar(None, pa.string()), trimmed)
+
+
+def _remove_html_tags_batch(values: "pa.Array") -> "pa.Array":
+    import pyarrow.compute as pc
+
+    return _clean_whitespace_batch(pc.replace_substring_regex(values, _HTML_TAG_RE.pattern, ""))
+
+
+def _truncate_text_batch(values: "pa.Array", max_length: int = 100) -> "pa.Array":
+    import pyarrow.compute as pc
+
+    head = pc.utf8_slice_codeunits(values, 0, max_length)
+    truncated = pc.binary_join_element_wise(
+        pc.utf8_rtrim(head, characters=_ASCII_WHITESPACE), "...", ""
+    )
+    return pc.if_else(pc.less_equal(pc.utf8_length(values), max_length), values, truncated)
+
+
+def _uppercase_batch(values: "pa.Array") -> "pa.Array":
+    import pyarrow.compute as pc
+
+    return pc.ascii_upper(values)
+
+
+def _lowercase_batch(values: "pa.Array") -> "pa.Array":
+    import pyarrow.compute as pc
+
+    return pc.ascii_lower(values)
+
+
+# Vectorized equivalents keyed by the scalar function, so aliases share a
+# kernel and a custom transform registered over a built-in name is honoured.
+_BATCH_KERNELS: dict[Callable[..., Any], Callable[..., Any]] = {
+    normalize_text: _clean_whitespace_batch,
+    clean_whitespace: _clean_whitespace_batch,
+    remove_html_tags: _remove_html_tags_batch,
+    truncate_text: _truncate_text_batch,
+    uppercase: _uppercase_batch,
+    lowercase: _lowercase_batch,
+}
+
+
+def supports_batch(transformation: str) -> bool:
+    """Return True if the named transformation has a vectorized kernel."""
+    return _DISPATCH.get(transformation) in _BATCH_KERNELS
+
+
+def apply_batch(values: "pa.Array", transformation: str, **kwargs: Any) -> "pa.Array":
+    """
+    Apply named transformation to every element of an Arrow array.
+
+    Built-in string transforms run as pyarrow.compute kernels when the array
+    is ASCII-only strings; anything else is applied element by element with
+    the same results as apply_transformation.
+
+    Args:
+        values: Input array
+        transformation: Transformation name
+        **kwargs: Additional arguments for transformation
+
+    Returns:
+        Transformed array
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    func = _DISPATCH.get(transformation)
+    if func is None:
+        raise ValueError(f"Unknown transformation: {transformation}")
+
+    kernel = _BATCH_KERNELS.get(func)
+    if (
+        kernel is not None
+        and pa.types.is_string(values.type)
+        and pc.all(pc.string_is_ascii(values)).as_py() is not False
+    ):
+        return kernel(values, **kwargs)
+
+    return pa.array([func(value, **kwargs) for value in values.to_pylist()])
@@ -1,12 +1,14 @@
 """Interactive guide for finding API endpoints in infinite scroll sites."""
 
-from rich.console import Console
-from rich.markdown import Markdown
-from rich.panel import Panel
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import TYPE_CHECKING
 
 from quarry.lib.theme import COLORS, QUARRY_THEME
 
-console = Console(theme=QUARRY_THEME)
+if TYPE_CHECKING:
+    from rich.markdown import Markdown
 
 
 API_GUIDE_TEXT = """
@@ -134,8 +136,21 @@ Find the API, scrape it directly, skip the browser automation complexity.
 """
 
 
+@lru_cache(maxsize=1)
+def _guide_markdown() -> Markdown:
+    """Parse the guide once; Markdown objects can be printed repeatedly."""
+    from rich.markdown import Markdown
+
+    return Markdown(API_GUIDE_TEXT)
+
+
 def show_api_guide():
     """Display the interactive API finding guide."""
+    # rich's console and Markdown renderer are only loaded when the guide is shown
+    from rich.console import Console
+    from rich.panel import Panel
+
+    console = Console(theme=QUARRY_THEME)
     console.print()
     console.print(
         Panel(
@@ -147,8 +162,7 @@ def show_api_guide():
     )
     console.print()
 
-    md = Markdown(API_GUIDE_TEXT)
-    console.print(md)
+    console.print(_guide_markdown())
 
     console.print()
     console.print(
@@ -7,6 +7,7 @@ import click
 import questionary
 
 from quarry.lib import paths
+from quarry.lib.analysis_cache import AnalysisCache
 from quarry.lib.http import get_html
 from quarry.lib.prompts import prompt_choice, prompt_confirm, prompt_file, prompt_url
 
@@ -32,13 +33,23 @@ from .reporter import format_as_json, format_as_terminal
 @click.option(
     "--find-api", is_flag=True, help="Show guide for finding API endpoints (infinite scroll sites)"
 )
+@click.option(
+    "--no-cache", is_flag=True, help="Re-analyze even if this exact page was analyzed recently"
+)
+@click.option(
+    "--cache-ttl",
+    type=int,
+    default=86400,
+    show_default=True,
+    help="Seconds a cached analysis stays valid",
+)
 @click.option(
     "--batch/--interactive",
     "batch_mode",
     default=False,
     help="Batch mode (skip prompts, fail if arguments missing)",
 )
-def scout(url_or_file, file, output, format, pretty, find_api, batch_mode):
+def scout(url_or_file, file, output, format, pretty, find_api, no_cache, cache_ttl, batch_mode):
     """
     Analyze HTML structure and detect patterns.
 
@@ -60,6 +71,7 @@ def scout(url_or_file, file, output, format, pretty, find_api, batch_mode):
       quarry scout https://news.ycombinator.com
       quarry scout --file page.html --format json
       quarry scout https://github.com --output analysis.json --batch
+      quarry scout https://github.com --no-cache  # Ignore cached analysis
       quarry scout --find-api  # Guide for infinite scroll sites
     """
 
@@ -156,13 +168,20 @@ def scout(url_or_file, file, output, format, pretty, find_api, batch_mode):
         click.echo("Error: No HTML content retrieved", err=True)
         sys.exit(1)
 
-    # Analyze
-    click.echo("🔍 Analyzing...", err=True)
-    try:
-        analysis = analyze_page(html, url=url)
-    except Exception as e:
-        click.echo(f"Error during analysis: {e}", err=True)
-        sys.exit(1)
+    # Analyze, reusing the result for a page whose URL and HTML are unchanged
+    cache = None if no_cache else AnalysisCache(ttl_seconds=cache_ttl)
+    analysis = cache.get(html, url) if cache else None
+    if analysis is not None:
+        click.echo("🔍 Using cached analysis (--no-cache to re-run)", err=True)
+    else:
+        click.echo("🔍 Analyzing...", err=True)
+        try:
+            analysis = analyze_page(html, url=url)
+        except Exception as e:
+            click.echo(f"Error during analysis: {e}", err=True)
+            sys.exit(1)
+        if cache:
+            cache.put(html, url, analysis)
 
     # Format output
     if format.lower() == "json":
@@ -5,6 +5,26 @@ from typing import Any
 
 from quarry.lib.theme import COLORS
 
+# Markup that depends only on the theme colours, built once at import
+_BANNER_EDGE_TOP = "╭────────────────────────────────────────────────────╮"
+_BANNER_TITLE = (
+    f"│ [bold {COLORS['primary']}]SCOUT ANALYSIS[/bold {COLORS['primary']}]"
+    "                            │"
+)
+_BANNER_EDGE_BOTTOM = "╰────────────────────────────────────────────────────╯"
+_BULLET = f"[{COLORS['primary']}]•[/{COLORS['primary']}]"
+_RECOMMENDED_HEADING = (
+    f"[bold {COLORS['success']}]Recommended Selector[/bold {COLORS['success']}]\n\n"
+)
+_INFINITE_SCROLL_HEADING = (
+    f"[bold {COLORS['warning']}]⚠ Infinite Scroll Detected[/bold {COLORS['warning']}]"
+)
+_INFINITE_SCROLL_SOLUTION = (
+    f"\n[bold {COLORS['primary']}]💡 Solution:[/bold {COLORS['primary']}] "
+    "Find the underlying API endpoint\n"
+    f"[dim]Run:[/dim] [{COLORS['primary']}]quarry scout --find-api[/{COLORS['primary']}]"
+)
+
 
 def format_as_json(analysis: dict[str, Any], pretty: bool = True) -> str:
     """
@@ -49,16 +69,9 @@ def format_as_terminal(analysis: dict[str, Any]) -> str:
         # Header with elegant spacing (Mars/Jupiter theme)
         url = analysis.get("url", "")
         console.print()
-        console.print(
-            "╭────────────────────────────────────────────────────╮", style=COLORS["primary"]
-        )
-        console.print(
-            f"│ [bold {COLORS['primary']}]SCOUT ANALYSIS[/bold {COLORS['primary']}]                            │",
-            style=COLORS["primary"],
-        )
-        console.print(
-            "╰────────────────────────────────────────────────────╯", style=COLORS["primary"]
-        )
+        console.print(_BANNER_EDGE_TOP, style=COLORS["primary"])
+        console.print(_BANNER_TITLE, style=COLORS["primary"])
+        console.print(_BANNER_EDGE_BOTTOM, style=COLORS["primary"])
 
         if url:
             console.print(f"[dim]{url}[/dim]")
@@ -150,7 +163,7 @@ def format_as_terminal(analysis: dict[str, Any]) -> str:
 
             console.print(
                 Panel(
-                    f"[bold {COLORS['success']}]Recommended Selector[/bold {COLORS['success']}]\n\n"
+                    f"{_RECOMMENDED_HEADING}"
                     f"[{COLORS['secondary']}]{selector}[/{COLORS['secondary']}]\n"
                     f"[dim]Found {count} items matching this pattern[/dim]",
                     title="Best Container",
@@ -215,14 +228,13 @@ def format_as_terminal(analysis: dict[str, Any]) -> str:
             confidence = infinite_scroll.get("confidence", 0) * 100
             signals = infinite_scroll.get("signals", [])
 
-            warning_text = f"[bold {COLORS['warning']}]⚠ Infinite Scroll Detected[/bold {COLORS['warning']}] ({confidence:.0f}% confidence)\n\n"
+            warning_text = f"{_INFINITE_SCROLL_HEADING} ({confidence:.0f}% confidence)\n\n"
             warning_text += "[dim]This page appears to use infinite scroll. Traditional selectors may not work.[/dim]\n\n"
             warning_text += "[bold]Detected signals:[/bold]\n"
             for signal in signals[:5]:
                 warning_text += f"  • {signal}\n"
 
-            warning_text += f"\n[bold {COLORS['primary']}]💡 Solution:[/bold {COLORS['primary']}] Find the underlying API endpoint\n"
-            warning_text += f"[dim]Run:[/dim] [{COLORS['primary']}]quarry scout --find-api[/{COLORS['primary']}]"
+            warning_text += _INFINITE_SCROLL_SOLUTION
 
             console.print(
                 Panel(
@@ -240,11 +252,11 @@ def format_as_terminal(analysis: dict[str, Any]) -> str:
         if stats:
             console.print(
                 Panel(
-                    f"[{COLORS['primary']}]•[/{COLORS['primary']}] Elements: [bold]{stats.get('total_elements', 0):,}[/bold]\n"
-                    f"[{COLORS['primary']}]•[/{COLORS['primary']}] Links: [bold]{stats.get('total_links', 0):,}[/bold]\n"
-                    f"[{COLORS['primary']}]•[/{COLORS['primary']}] Images: [bold]{stats.get('total_images', 0):,}[/bold]\n"
-                    f"[{COLORS['primary']}]•[/{COLORS['primary']}] Forms: [bold]{stats.get('total_forms', 0):,}[/bold]\n"
-                    f"[{COLORS['primary']}]•[/{COLORS['primary']}] Text: [bold]{stats.get('text_words', 0):,}[/bold] words",
+                    f"{_BULLET} Elements: [bold]{stats.get('total_elements', 0):,}[/bold]\n"
+                    f"{_BULLET} Links: [bold]{stats.get('total_links', 0):,}[/bold]\n"
+                    f"{_BULLET} Images: [bold]{stats.get('total_images', 0):,}[/bold]\n"
+                    f"{_BULLET} Forms: [bold]{stats.get('total_forms', 0):,}[/bold]\n"
+                    f"{_BULLET} Text: [bold]{stats.get('text_words', 0):,}[/bold] words",
                     title="Page Statistics",
                     title_align="left",
                     border_style=COLORS["tertiary"],
@@ -1,16 +1,42 @@
 """Crate - Data export tool."""
 
-from .base import Exporter, ExporterFactory
-from .exporters import (
-    CSVExporter,
-    JSONExporter,
-    SQLiteExporter,
-)
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from quarry.lib.lazy import lazy_module_attrs
+
+if TYPE_CHECKING:
+    from .base import Exporter, ExporterFactory
+    from .exporters import (
+        CSVExporter,
+        JSONExporter,
+        ParquetExporter,
+        SQLiteExporter,
+        get_pg_pool,
+    )
+
+# Re-exports are loaded on first access (PEP 562); ExporterFactory imports
+# the concrete exporters itself only when one is created.
+_LAZY_ATTRS = {
+    "CSVExporter": ".exporters",
+    "Exporter": ".base",
+    "ExporterFactory": ".base",
+    "JSONExporter": ".exporters",
+    "ParquetExporter": ".exporters",
+    "SQLiteExporter": ".exporters",
+    "get_pg_pool": ".exporters",
+}
 
 __all__ = [
     "CSVExporter",
     "Exporter",
     "ExporterFactory",
     "JSONExporter",
+    "ParquetExporter",
     "SQLiteExporter",
+    "get_pg_pool",
 ]
+
+
+__getattr__, __dir__ = lazy_module_attrs(__name__, _LAZY_ATTRS)
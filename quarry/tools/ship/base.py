@@ -2,10 +2,14 @@
 
 import json
 from abc import ABC, abstractmethod
-from collections.abc import Iterator
+from collections import deque
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
 from pathlib import Path
 from typing import Any
 
+from quarry.lib import fastjson
+
 
 class Exporter(ABC):
     """
@@ -13,8 +17,17 @@ class Exporter(ABC):
 
     All exporters must implement the export() method to write
     data from a JSONL file to their target destination.
+
+    Options common to row-based exporters:
+        workers: Processes used to decode and coerce rows (default: 1).
+                 Only files of at least PARALLEL_MIN_BYTES are split.
     """
 
+    # Files smaller than this are always converted in-process
+    PARALLEL_MIN_BYTES = 16 << 20
+    # Size of the line-aligned byte ranges handed to each worker task
+    PARALLEL_RANGE_BYTES = 4 << 20
+
     def __init__(self, destination: str, **options: Any):
         """
         Initialize exporter.
@@ -44,39 +57,189 @@ class Exporter(ABC):
         """
         pass
 
-    def _read_jsonl(self, input_file: str | Path) -> Iterator[dict[str, Any]]:
+    def _read_jsonl(
+        self, input_file: str | Path, *, count: bool = True
+    ) -> Iterator[dict[str, Any]]:
         """
         Read records from JSONL file.
 
         Args:
             input_file: Path to JSONL file
+            count: Update records_read/records_failed. Pass False when the
+                   file was already read (and counted) by an earlier pass.
 
         Yields:
             Dictionary records
         """
         input_path = Path(input_file)
 
-        with input_path.open("r", encoding="utf-8") as f:
+        with input_path.open("rb") as f:
             for line in f:
                 line = line.strip()
                 if not line:
                     continue
 
                 try:
-                    record = json.loads(line)
-                    self.stats["records_read"] += 1
+                    record = fastjson.loads(line)
+                    if count:
+                        self.stats["records_read"] += 1
                     yield record
                 except json.JSONDecodeError:
-                    self.stats["records_failed"] += 1
+                    if count:
+                        self.stats["records_failed"] += 1
                     continue
 
+    def _iter_rows(
+        self,
+        input_file: str | Path,
+        columns: list[str],
+        coerce: Callable[[Any], Any],
+        *,
+        count: bool = True,
+    ) -> Iterator[list[Any]]:
+        """
+        Yield each record as a list of coerced values in column order.
+
+        With the workers option above 1 and a large enough file, decoding
+        and coercion run in worker processes over line-aligned byte ranges
+        of the file. Rows are still yielded in file order.
+
+        Args:
+            input_file: Path to JSONL file
+            columns: Column names, in output order
+            coerce: Converts one non-str record value to its output form;
+                plain strings, the common case in scraped data, pass through
+            count: Update records_read/records_failed (see _read_jsonl)
+
+        Yields:
+            Row value lists
+        """
+        input_path = Path(input_file)
+        workers = int(self.options.get("workers", 1))
+        if workers > 1 and input_path.stat().st_size >= self.PARALLEL_MIN_BYTES:
+            yield from self._iter_rows_parallel(input_path, columns, coerce, workers, count)
+            return
+
+        for record in self._read_jsonl(input_path, count=count):
+            if not isinstance(record, dict):
+                self.stats["records_failed"] += 1
+                continue
+            yield [v if v.__class__ is str else coerce(v) for v in map(record.get, columns)]
+
+    def _iter_rows_parallel(
+        self,
+        input_path: Path,
+        columns: list[str],
+        coerce: Callable[[Any], Any],
+        workers: int,
+        count: bool,
+    ) -> Iterator[list[Any]]:
+        """Fan byte ranges out to a process pool, keeping a bounded backlog."""
+        pool = ProcessPoolExecutor(max_workers=workers)
+        pending: deque[Future[tuple[list[list[Any]], int, int]]] = deque()
+        try:
+            for start, end in _byte_ranges(input_path, self.PARALLEL_RANGE_BYTES):
+                pending.append(
+                    pool.submit(_coerce_range, str(input_path), start, end, columns, coerce)
+                )
+                if len(pending) > workers * 2:
+                    yield from self._take_rows(pending.popleft(), count)
+            while pending:
+                yield from self._take_rows(pending.popleft(), count)
+        finally:
+            pool.shutdown(cancel_futures=True)
+
+    def _take_rows(
+        self, future: Future[tuple[list[list[Any]], int, int]], count: bool
+    ) -> list[list[Any]]:
+        """Collect one worker result, folding its counts into the stats."""
+        rows, read, failed = future.result()
+        if count:
+            self.stats["records_read"] += read
+            self.stats["records_failed"] += failed
+        # Non-object records are failures even when decoding was counted earlier
+        self.stats["records_failed"] += read - len(rows)
+        return rows
+
+    def _collect_columns(
+        self, input_file: str | Path, exclude_meta: bool, sort: bool = True
+    ) -> list[str]:
+        """
+        Scan a JSONL file for the union of its record keys.
+
+        Only keys are kept, so memory stays flat regardless of file size.
+        This pass updates records_read/records_failed; read the records
+        again with count=False.
+
+        Args:
+            input_file: Path to JSONL file
+            exclude_meta: Leave out the _meta field
+            sort: Sort the names; otherwise keep first-seen order
+
+        Returns:
+            Column names
+        """
+        # A dict keeps first-seen order; records that add no new keys are
+        # skipped with a C-level subset check
+        columns: dict[str, None] = {}
+        for record in self._read_jsonl(input_file):
+            if not record.keys() <= columns.keys():
+                columns.update(dict.fromkeys(record))
+
+        if exclude_meta:
+            columns.pop("_meta", None)
+        return sorted(columns) if sort else list(columns)
+
+
+def _byte_ranges(path: Path, step: int) -> Iterator[tuple[int, int]]:
+    """Split a file into consecutive byte ranges that end on line boundaries."""
+    size = path.stat().st_size
+    with path.open("rb") as f:
+        start = 0
+        while start < size:
+            f.seek(min(start + step, size))
+            f.readline()
+            end = f.tell()
+            yield start, end
+            start = end
+
+
+def _coerce_range(
+    path: str, start: int, end: int, columns: list[str], coerce: Callable[[Any], Any]
+) -> tuple[list[list[Any]], int, int]:
+    """
+    Decode and coerce the JSONL lines in one byte range (worker process).
+
+    Returns:
+        (rows, records decoded, lines that failed to decode)
+    """
+    with open(path, "rb") as f:
+        f.seek(start)
+        data = f.read(end - start)
+
+    rows: list[list[Any]] = []
+    read = failed = 0
+    for line in data.split(b"\n"):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            record = fastjson.loads(line)
+        except json.JSONDecodeError:
+            failed += 1
+            continue
+        read += 1
+        if isinstance(record, dict):
+            rows.append([v if v.__class__ is str else coerce(v) for v in map(record.get, columns)])
+    return rows, read, failed
+
 
 class ExporterFactory:
     """
     Factory for creating appropriate exporters based on destination.
 
     Supports automatic format detection from:
-    - File extensions (.csv, .json, .db, .sqlite)
+    - File extensions (.csv, .json, .db, .sqlite, .parquet)
     - Connection strings (postgresql://, mysql://, sqlite://)
     """
 
@@ -95,7 +258,13 @@ class ExporterFactory:
         Raises:
             ValueError: If destination format cannot be determined
         """
-        from .exporters import CSVExporter, JSONExporter, PostgresExporter, SQLiteExporter
+        from .exporters import (
+            CSVExporter,
+            JSONExporter,
+            ParquetExporter,
+            PostgresExporter,
+            SQLiteExporter,
+        )
 
         dest_lower = destination.lower()
 
@@ -109,6 +278,9 @@ class ExporterFactory:
         elif dest_lower.endswith((".db", ".sqlite", ".sqlite3")):
             return SQLiteExporter(destination, **options)
 
+        elif dest_lower.endswith(".parquet"):
+            return ParquetExporter(destination, **options)
+
         # Connection string-based exporters
         elif dest_lower.startswith("sqlite://"):
             # Remove scheme for file path
@@ -124,5 +296,5 @@ class ExporterFactory:
         else:
             raise ValueError(
                 f"Cannot determine export format for: {destination}\n"
-                f"Supported: .csv, .json, .db/.sqlite, sqlite://, postgresql://"
+                f"Supported: .csv, .json, .db/.sqlite, .parquet, sqlite://, postgresql://"
             )
@@ -1,13 +1,39 @@
 """Concrete exporter implementations."""
 
 import csv
+import functools
 import json
+import os
 import sqlite3
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
 
+from quarry.lib.fastjson import has_non_finite, orjson
+
 from .base import Exporter
 
+# Connections per Postgres export pool when QUARRY_PG_POOL is unset
+_DEFAULT_PG_POOL_SIZE = 4
+
+
+def _sql_value(value: Any) -> str | None:
+    """Convert a record value to its SQL TEXT parameter (None stays NULL)."""
+    if value is None:
+        return None
+    if isinstance(value, (list, dict)):
+        return json.dumps(value)
+    return str(value)
+
+
+def _csv_value(value: Any) -> str:
+    """Convert a record value to its CSV cell text."""
+    if value is None:
+        return ""
+    if isinstance(value, (list, dict)):
+        return json.dumps(value)
+    return str(value)
+
 
 class CSVExporter(Exporter):
     """
@@ -18,6 +44,10 @@ class CSVExporter(Exporter):
         quoting: CSV quoting style (default: QUOTE_MINIMAL)
         encoding: File encoding (default: 'utf-8')
         exclude_meta: Exclude _meta field (default: True)
+        headers: Column names in output order; skips the header pre-scan
+                 (default: all record keys, sorted)
+        sort_columns: Sort scanned headers; False keeps first-seen order
+                      (default: True)
     """
 
     def export(self, input_file: str | Path) -> dict[str, int]:
@@ -31,50 +61,33 @@ class CSVExporter(Exporter):
         encoding = self.options.get("encoding", "utf-8")
         exclude_meta = self.options.get("exclude_meta", True)
 
-        # Collect all records to determine headers
-        records: list[dict[str, object]] = []
-        for record in self._read_jsonl(input_file):
-            if exclude_meta and "_meta" in record:
-                record = {k: v for k, v in record.items() if k != "_meta"}
-            records.append(record)
-
-        if not records:
-            # No records, create empty file
-            output_path.write_text("", encoding=encoding)
-            return self.stats
-
-        # Determine headers from all records
-        headers_set: set[str] = set()
-        for record in records:
-            headers_set.update(record.keys())
-        headers: list[str] = sorted(headers_set)  # Consistent order
+        # Headers come from a keys-only pre-scan (or the caller), then rows
+        # are streamed straight from the file without holding records
+        headers: list[str] | None = self.options.get("headers")
+        if headers is None:
+            headers = self._collect_columns(
+                input_file, exclude_meta, self.options.get("sort_columns", True)
+            )
+            rows = self._iter_rows(input_file, headers, _csv_value, count=False)
+        else:
+            if exclude_meta:
+                headers = [h for h in headers if h != "_meta"]
+            rows = self._iter_rows(input_file, headers, _csv_value)
 
         # Write CSV
         with output_path.open("w", encoding=encoding, newline="") as f:
-            writer = csv.DictWriter(
-                f,
-                fieldnames=headers,
-                delimiter=delimiter,
-                quoting=quoting,
-            )
+            writer = csv.writer(f, delimiter=delimiter, quoting=quoting)
 
-            writer.writeheader()
-            for record in records:
+            wrote_header = False
+            for row in rows:
+                if not wrote_header:
+                    writer.writerow(headers)
+                    wrote_header = True
                 try:
-                    # Convert non-string values
-                    row: dict[str, str] = {}
-                    for key in headers:
-                        value = record.get(key)
-                        if value is None:
-                            row[key] = ""
-                        elif isinstance(value, (list, dict)):
-                            row[key] = json.dumps(value)
-                        else:
-                            row[key] = str(value)
-
                     writer.writerow(row)
                     self.stats["records_written"] += 1
-                except Exception:
+                except (csv.Error, UnicodeEncodeError):
+                    # e.g. a delimiter under QUOTE_NONE, or text the encoding lacks
                     self.stats["records_failed"] += 1
 
         return self.stats
@@ -100,22 +113,49 @@ class JSONExporter(Exporter):
         indent = self.options.get("indent", 2) if pretty else None
         exclude_meta = self.options.get("exclude_meta", False)
 
-        # Collect all records
-        records = []
-        for record in self._read_jsonl(input_file):
-            if exclude_meta and "_meta" in record:
-                record = {k: v for k, v in record.items() if k != "_meta"}
-
-            records.append(record)
-            self.stats["records_written"] += 1
+        # Stream the array one record at a time, with the same item layout
+        # json.dump/orjson.dumps give a whole list, so memory stays flat
+        use_orjson = orjson is not None and indent in (None, 2)
+        if indent is None:
+            pad = b""
+            separator = b"," if use_orjson else b", "
+        else:
+            pad = b"\n" + b" " * indent
+            separator = b"," + pad
+
+        with output_path.open("wb") as f:
+            f.write(b"[")
+            for record in self._read_jsonl(input_file):
+                if exclude_meta and "_meta" in record:
+                    record = {k: v for k, v in record.items() if k != "_meta"}
 
-        # Write JSON array
-        with output_path.open("w", encoding="utf-8") as f:
-            json.dump(records, f, indent=indent, default=str)
+                item = _dump_json(record, indent, use_orjson)
+                if pad:
+                    item = item.replace(b"\n", pad)
+                f.write((separator if self.stats["records_written"] else pad) + item)
+                self.stats["records_written"] += 1
+            f.write(b"\n]" if pad and self.stats["records_written"] else b"]")
 
         return self.stats
 
 
+def _dump_json(value: Any, indent: int | None, use_orjson: bool) -> bytes:
+    """Encode one array item for JSONExporter."""
+    if use_orjson:
+        if not has_non_finite(value):
+            try:
+                return orjson.dumps(value, option=orjson.OPT_INDENT_2 if indent else 0, default=str)
+            except TypeError:
+                pass
+        # NaN/Infinity (which orjson writes as null) and integers wider than
+        # 64 bits; the stdlib encoder keeps them, laid out the way orjson would
+        separators = (",", ":") if indent is None else None
+        return json.dumps(
+            value, indent=indent, separators=separators, ensure_ascii=False, default=str
+        ).encode()
+    return json.dumps(value, indent=indent, default=str).encode()
+
+
 class SQLiteExporter(Exporter):
     """
     Export data to SQLite database.
@@ -124,8 +164,14 @@ class SQLiteExporter(Exporter):
         table_name: Table name (default: 'records')
         if_exists: 'replace', 'append', or 'fail' (default: 'replace')
         exclude_meta: Exclude _meta field (default: True)
+        schema: Column names; skips the schema pre-scan
+                (default: all record keys, sorted)
+        sort_columns: Sort scanned columns; False keeps first-seen order
+                      (default: True)
     """
 
+    CHUNK_SIZE = 1_000
+
     def export(self, input_file: str | Path) -> dict[str, int]:
         """Export JSONL to SQLite database."""
         db_path = Path(self.destination)
@@ -145,23 +191,22 @@ class SQLiteExporter(Exporter):
         cursor = conn.cursor()
 
         try:
-            # Read first batch to determine schema
-            records: list[dict[str, object]] = []
-            columns: set[str] = set()
-
-            for record in self._read_jsonl(input_file):
-                if exclude_meta and "_meta" in record:
-                    record = {k: v for k, v in record.items() if k != "_meta"}
-
-                columns.update(record.keys())
-                records.append(record)
+            # Schema comes from a keys-only pre-scan (or the caller); rows are
+            # streamed from a second read so memory stays at one chunk
+            columns_list: list[str] | None = self.options.get("schema")
+            if columns_list is None:
+                columns_list = self._collect_columns(
+                    input_file, exclude_meta, self.options.get("sort_columns", True)
+                )
+                rows = self._iter_rows(input_file, columns_list, _sql_value, count=False)
+            else:
+                if exclude_meta:
+                    columns_list = [col for col in columns_list if col != "_meta"]
+                rows = self._iter_rows(input_file, columns_list, _sql_value)
 
-            if not records:
-                conn.close()
+            if not columns_list:
                 return self.stats
 
-            columns_list: list[str] = sorted(columns)  # Consistent order
-
             # Handle if_exists
             if if_exists == "replace":
                 cursor.execute(f"DROP TABLE IF EXISTS {table_name}")
@@ -173,7 +218,7 @@ class SQLiteExporter(Exporter):
                     raise ValueError(f"Table '{table_name}' already exists")
 
             # Create table
-            column_defs = ", ".join(f'"{col}" TEXT' for col in columns)
+            column_defs = ", ".join(f'"{col}" TEXT' for col in columns_list)
             cursor.execute(f"CREATE TABLE IF NOT EXISTS {table_name} ({column_defs})")
 
             # Insert records
@@ -181,22 +226,17 @@ class SQLiteExporter(Exporter):
             column_names = ", ".join(f'"{col}"' for col in columns_list)
             insert_sql = f'INSERT INTO {table_name} ({column_names}) VALUES ({placeholders})'
 
-            for record in records:
-                try:
-                    values: list[str | None] = []
-                    for col in columns_list:
-                        value = record.get(col)
-                        if value is None:
-                            values.append(None)
-                        elif isinstance(value, (list, dict)):
-                            values.append(json.dumps(value))
-                        else:
-                            values.append(str(value))
-
-                    cursor.execute(insert_sql, values)
-                    self.stats["records_written"] += 1
-                except Exception:
-                    self.stats["records_failed"] += 1
+            # Insert in chunks inside one transaction: executemany binds the
+            # parameters in C and the journal is written once at commit
+            conn.execute("BEGIN")
+            chunk: list[list[str | None]] = []
+            for row in rows:
+                chunk.append(row)
+                if len(chunk) >= self.CHUNK_SIZE:
+                    self._insert_chunk(conn, insert_sql, chunk)
+                    chunk = []
+            if chunk:
+                self._insert_chunk(conn, insert_sql, chunk)
 
             conn.commit()
 
@@ -205,6 +245,207 @@ class SQLiteExporter(Exporter):
 
         return self.stats
 
+    def _insert_chunk(
+        self, conn: sqlite3.Connection, insert_sql: str, rows: list[list[str | None]]
+    ) -> None:
+        """
+        Insert rows with one executemany call.
+
+        If any row fails, the chunk is rolled back to its savepoint and
+        each half is retried the same way, so only the failing rows count
+        as failed while the good rows still go in as batches.
+        """
+        conn.execute("SAVEPOINT chunk")
+        try:
+            conn.executemany(insert_sql, rows)
+        except sqlite3.Error:
+            conn.execute("ROLLBACK TO chunk")
+            if len(rows) == 1:
+                self.stats["records_failed"] += 1
+            else:
+                middle = len(rows) // 2
+                self._insert_chunk(conn, insert_sql, rows[:middle])
+                self._insert_chunk(conn, insert_sql, rows[middle:])
+        else:
+            self.stats["records_written"] += len(rows)
+        finally:
+            conn.execute("RELEASE chunk")
+
+
+class ParquetExporter(Exporter):
+    """
+    Export data to Parquet format.
+
+    Column types come from a pass over every record: columns holding only
+    booleans, integers or numbers are written as bool/int64/float64;
+    anything else, including nested values as JSON text, is stored as
+    strings. Integers join a float column only while float64 holds them
+    exactly.
+
+    Options:
+        compression: Parquet codec (default: 'zstd')
+        exclude_meta: Exclude _meta field (default: True)
+        sort_columns: Sort columns; False keeps first-seen order
+                      (default: True)
+    """
+
+    ROW_GROUP_SIZE = 64_000
+
+    def export(self, input_file: str | Path) -> dict[str, int]:
+        """Export JSONL to Parquet."""
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        output_path = Path(self.destination)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Options
+        compression = self.options.get("compression", "zstd")
+        exclude_meta = self.options.get("exclude_meta", True)
+
+        kinds = self._collect_kinds(
+            input_file, exclude_meta, self.options.get("sort_columns", True)
+        )
+        if not kinds:
+            return self.stats
+
+        arrow_types = {
+            "bool": pa.bool_(),
+            "int": pa.int64(),
+            "int64": pa.int64(),
+            "float": pa.float64(),
+        }
+        schema = pa.schema(
+            [(col, arrow_types.get(kind or "string", pa.string())) for col, kind in kinds.items()]
+        )
+        text_columns = [i for i, kind in enumerate(kinds.values()) if kind not in arrow_types]
+        rows = self._iter_rows(input_file, list(kinds), _parquet_value, count=False)
+
+        with pq.ParquetWriter(
+            output_path, schema, compression=compression, use_dictionary=True
+        ) as writer:
+            chunk: list[list[Any]] = []
+            for row in rows:
+                chunk.append(row)
+                if len(chunk) >= self.ROW_GROUP_SIZE:
+                    writer.write_batch(_record_batch(pa, schema, text_columns, chunk))
+                    self.stats["records_written"] += len(chunk)
+                    chunk = []
+            if chunk:
+                writer.write_batch(_record_batch(pa, schema, text_columns, chunk))
+                self.stats["records_written"] += len(chunk)
+
+        return self.stats
+
+    def _collect_kinds(
+        self, input_file: str | Path, exclude_meta: bool, sort: bool = True
+    ) -> dict[str, str | None]:
+        """
+        Scan a JSONL file for its columns and the kind of value each holds.
+
+        Like _collect_columns, this pass does the counting; read the
+        records again with count=False.
+
+        Returns:
+            Column name -> "bool", "int", "int64", "float", "string", or
+            None for columns that are always null
+        """
+        kinds: dict[str, str | None] = {}
+        for record in self._read_jsonl(input_file):
+            if not isinstance(record, dict):
+                continue  # counted as failed when the rows are read
+            for key, value in record.items():
+                if value is None:
+                    kinds.setdefault(key, None)
+                    continue
+                kind = _value_kind(value)
+                current = kinds.get(key)
+                if current is None:
+                    kinds[key] = kind
+                elif current != kind:
+                    kinds[key] = _merge_kinds(current, kind)
+
+        if exclude_meta:
+            kinds.pop("_meta", None)
+        if sort:
+            return {col: kinds[col] for col in sorted(kinds)}
+        return kinds
+
+
+def _parquet_value(value: Any) -> Any:
+    """Convert a record value for Parquet (nested values become JSON text)."""
+    if isinstance(value, (list, dict)):
+        return json.dumps(value)
+    return value
+
+
+def _value_kind(value: Any) -> str:
+    """Classify a non-null record value for Parquet type inference."""
+    cls = value.__class__
+    if cls is bool:
+        return "bool"
+    if cls is int:
+        # "int" values are also exact as float64; "int64" ones only fit int64
+        if -(2**53) <= value <= 2**53:
+            return "int"
+        return "int64" if -(2**63) <= value < 2**63 else "string"
+    if cls is float:
+        return "float"
+    return "string"
+
+
+def _merge_kinds(a: str, b: str) -> str:
+    """Widen two column kinds to one that holds both without loss."""
+    pair = {a, b}
+    if pair == {"int", "int64"}:
+        return "int64"
+    if pair == {"int", "float"}:
+        return "float"
+    return "string"
+
+
+def _record_batch(pa: Any, schema: Any, text_columns: list[int], rows: list[list[Any]]) -> Any:
+    """Transpose rows into one Arrow record batch, stringifying text columns."""
+    data = [list(values) for values in zip(*rows, strict=True)]
+    for i in text_columns:
+        data[i] = [v if v is None or v.__class__ is str else str(v) for v in data[i]]
+    return pa.record_batch(data, schema=schema)
+
+
+@functools.cache
+def get_pg_pool(dsn: str) -> Any:
+    """
+    Get the shared connection pool for a PostgreSQL connection string.
+
+    The pool comes from the registry in quarry.sinks.postgres, so exports
+    and sinks for one database use the same connections. Exports hold
+    their reference for the life of the process, so repeated exports skip
+    the connect, TLS and auth handshake; the pool is closed at interpreter
+    exit. The pool size comes from QUARRY_PG_POOL (default: 4).
+
+    Args:
+        dsn: PostgreSQL connection string
+
+    Returns:
+        psycopg_pool.ConnectionPool
+
+    Raises:
+        PostgresConnectionError: If psycopg is missing or the server cannot
+            be reached
+    """
+    from quarry.sinks.postgres import acquire_pool  # noqa: PLC0415
+
+    return acquire_pool(dsn, _pg_pool_size())
+
+
+def _pg_pool_size() -> int:
+    """Read the pool size from QUARRY_PG_POOL, falling back to the default."""
+    try:
+        size = int(os.environ.get("QUARRY_PG_POOL", ""))
+    except ValueError:
+        return _DEFAULT_PG_POOL_SIZE
+    return size if size > 0 else _DEFAULT_PG_POOL_SIZE
+
 
 class PostgresExporter(Exporter):
     """
@@ -215,23 +456,31 @@ class PostgresExporter(Exporter):
         if_exists: 'replace', 'append', or 'fail' (default: 'append')
         upsert_key: Column for upsert conflict resolution (default: None)
         exclude_meta: Exclude _meta field (default: True)
+        connection: Open psycopg connection to use; it is left open
+                    (default: a pooled connection from get_pg_pool)
+
+    Rows are loaded with COPY FROM STDIN, or with a pipelined executemany
+    of INSERT ... ON CONFLICT when an upsert key is set. Either way the load
+    is all or nothing: a row the table rejects fails the whole export.
     """
 
     def export(self, input_file: str | Path) -> dict[str, int]:
         """Export JSONL to PostgreSQL database."""
+        connection = self.options.get("connection")
+        if connection is None:
+            with get_pg_pool(self.destination).connection() as conn:
+                return self._load(conn, input_file)
+
+        # Caller-owned connection: leave it open, but not mid-transaction
         try:
-            import psycopg  # noqa: PLC0415
-            import psycopg.sql as sql  # noqa: PLC0415, PLR0402
-        except ImportError as err:
-            from quarry.sinks.postgres import PostgresConnectionError
-
-            raise PostgresConnectionError(
-                "PostgreSQL support requires the 'psycopg' package.\n\n"
-                "Install it with:\n"
-                "  pip install 'psycopg[binary]'\n\n"
-                "Or add to your requirements.txt:\n"
-                "  psycopg[binary]"
-            ) from err
+            return self._load(connection, input_file)
+        except Exception:
+            connection.rollback()
+            raise
+
+    def _load(self, conn: Any, input_file: str | Path) -> dict[str, int]:
+        """Create the target table as needed and load the records into it."""
+        from psycopg import sql  # noqa: PLC0415
 
         # Options
         table_name = self.options.get("table_name", "records")
@@ -242,125 +491,88 @@ class PostgresExporter(Exporter):
         # Sanitize table name
         table_name = "".join(c for c in table_name if c.isalnum() or c == "_")
 
-        try:
-            conn = psycopg.connect(self.destination)
-        except Exception as e:
-            from quarry.sinks.postgres import PostgresConnectionError
-
-            error_msg = str(e).lower()
-
-            if "authentication failed" in error_msg or "password" in error_msg:
-                raise PostgresConnectionError(
-                    f"PostgreSQL authentication failed.\n\n"
-                    f"Check your username and password in the connection string.\n"
-                    f"Original error: {e}"
-                ) from e
-            elif "could not connect" in error_msg or "connection refused" in error_msg:
-                raise PostgresConnectionError(
-                    f"Cannot connect to PostgreSQL server.\n\n"
-                    f"Verify that:\n"
-                    f"  1. PostgreSQL is running on the specified host and port\n"
-                    f"  2. The hostname is correct and reachable\n"
-                    f"  3. Firewall rules allow the connection\n\n"
-                    f"Original error: {e}"
-                ) from e
-            else:
-                raise PostgresConnectionError(f"PostgreSQL connection failed: {e}") from e
-
-        try:
-            cursor = conn.cursor()
-
-            # Read records and determine schema
-            records: list[dict[str, Any]] = []
-            columns: set[str] = set()
-
-            for record in self._read_jsonl(input_file):
-                if exclude_meta and "_meta" in record:
-                    record = {k: v for k, v in record.items() if k != "_meta"}
-                columns.update(record.keys())
-                records.append(record)
-
-            if not records:
-                conn.close()
-                return self.stats
-
-            columns_list: list[str] = sorted(columns)
+        cursor = conn.cursor()
 
-            # Check if table exists
-            cursor.execute(
-                "SELECT EXISTS (SELECT 1 FROM information_schema.tables WHERE table_name = %s)",
-                (table_name,),
-            )
-            table_exists = cursor.fetchone()[0]
+        # Keys-only schema pass; rows are streamed from a second read
+        columns_list = self._collect_columns(input_file, exclude_meta)
+        if not columns_list:
+            return self.stats
 
-            # Handle if_exists
-            if table_exists:
-                if if_exists == "fail":
-                    raise ValueError(f"Table '{table_name}' already exists")
-                elif if_exists == "replace":
-                    cursor.execute(
-                        sql.SQL("DROP TABLE IF EXISTS {}").format(sql.Identifier(table_name))
-                    )
-                    table_exists = False
-
-            # Create table if needed
-            if not table_exists:
-                col_defs = sql.SQL(", ").join(
-                    sql.SQL("{} TEXT").format(sql.Identifier(col)) for col in columns_list
-                )
-                create_sql = sql.SQL("CREATE TABLE {} ({})").format(
-                    sql.Identifier(table_name),
-                    col_defs,
+        # Check if table exists
+        cursor.execute(
+            "SELECT EXISTS (SELECT 1 FROM information_schema.tables WHERE table_name = %s)",
+            (table_name,),
+        )
+        table_exists = cursor.fetchone()[0]
+
+        # Handle if_exists
+        if table_exists:
+            if if_exists == "fail":
+                raise ValueError(f"Table '{table_name}' already exists")
+            elif if_exists == "replace":
+                cursor.execute(
+                    sql.SQL("DROP TABLE IF EXISTS {}").format(sql.Identifier(table_name))
                 )
-                cursor.execute(create_sql)
-
-            # Build insert SQL
-            col_identifiers = [sql.Identifier(c) for c in columns_list]
+                table_exists = False
 
-            if upsert_key and upsert_key in columns_list:
-                # Upsert with ON CONFLICT
-                update_cols = [c for c in columns_list if c != upsert_key]
-                update_set = sql.SQL(", ").join(
-                    sql.SQL("{} = EXCLUDED.{}").format(sql.Identifier(c), sql.Identifier(c))
-                    for c in update_cols
-                )
-                insert_sql = sql.SQL(
-                    "INSERT INTO {} ({}) VALUES ({}) ON CONFLICT ({}) DO UPDATE SET {}"
-                ).format(
-                    sql.Identifier(table_name),
-                    sql.SQL(", ").join(col_identifiers),
-                    sql.SQL(", ").join(sql.Placeholder() for _ in columns_list),
-                    sql.Identifier(upsert_key),
-                    update_set,
-                )
-            else:
-                insert_sql = sql.SQL("INSERT INTO {} ({}) VALUES ({})").format(
-                    sql.Identifier(table_name),
-                    sql.SQL(", ").join(col_identifiers),
-                    sql.SQL(", ").join(sql.Placeholder() for _ in columns_list),
-                )
+        # Create table if needed
+        if not table_exists:
+            col_defs = sql.SQL(", ").join(
+                sql.SQL("{} TEXT").format(sql.Identifier(col)) for col in columns_list
+            )
+            create_sql = sql.SQL("CREATE TABLE {} ({})").format(
+                sql.Identifier(table_name),
+                col_defs,
+            )
+            cursor.execute(create_sql)
+
+        # Build load SQL
+        col_identifiers = [sql.Identifier(c) for c in columns_list]
+        rows = self._count_written(
+            self._iter_rows(input_file, columns_list, _sql_value, count=False)
+        )
+
+        if upsert_key and upsert_key in columns_list:
+            # Upsert with ON CONFLICT
+            update_cols = [c for c in columns_list if c != upsert_key]
+            update_set = sql.SQL(", ").join(
+                sql.SQL("{} = EXCLUDED.{}").format(sql.Identifier(c), sql.Identifier(c))
+                for c in update_cols
+            )
+            insert_sql = sql.SQL(
+                "INSERT INTO {} ({}) VALUES ({}) ON CONFLICT ({}) DO UPDATE SET {}"
+            ).format(
+                sql.Identifier(table_name),
+                sql.SQL(", ").join(col_identifiers),
+                sql.SQL(", ").join(sql.Placeholder() for _ in columns_list),
+                sql.Identifier(upsert_key),
+                update_set,
+            )
 
-            # Insert records
-            for record in records:
-                try:
-                    values: list[str | None] = []
-                    for col in columns_list:
-                        value = record.get(col)
-                        if value is None:
-                            values.append(None)
-                        elif isinstance(value, (list, dict)):
-                            values.append(json.dumps(value))
-                        else:
-                            values.append(str(value))
-
-                    cursor.execute(insert_sql, values)
-                    self.stats["records_written"] += 1
-                except Exception:
-                    self.stats["records_failed"] += 1
+            # One prepared statement, pipelined: rows are sent without
+            # waiting for each result
+            with conn.pipeline():
+                cursor.executemany(insert_sql, rows)
+        else:
+            # Plain append: stream every row through one COPY
+            copy_sql = sql.SQL("COPY {} ({}) FROM STDIN").format(
+                sql.Identifier(table_name),
+                sql.SQL(", ").join(col_identifiers),
+            )
+            with cursor.copy(copy_sql) as copy:
+                for values in rows:
+                    copy.write_row(values)
 
-            conn.commit()
+        conn.commit()
+        return self.stats
 
-        finally:
-            conn.close()
+    def _count_written(self, rows: Iterator[list[str | None]]) -> Iterator[list[str | None]]:
+        """
+        Pass rows through, counting each as written.
 
-        return self.stats
+        A failed load raises out of export(), so the count is only ever
+        reported for loads that went through.
+        """
+        for row in rows:
+            yield row
+            self.stats["records_written"] += 1
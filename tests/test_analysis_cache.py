@@ -0,0 +1,102 @@
+"""Tests for the scout analysis cache."""
+
+import sqlite3
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+from click.testing import CliRunner
+
+from quarry.lib import analysis_cache
+from quarry.lib.analysis_cache import AnalysisCache
+from quarry.tools.scout.cli import scout
+
+HTML = "<html><body><div class='item'>One</div></body></html>"
+ANALYSIS = {"url": "https://example.com", "containers": [], "statistics": {"total_elements": 4}}
+
+
+class TestAnalysisCache:
+    """Tests for AnalysisCache."""
+
+    def test_miss_then_hit(self, tmp_path):
+        """A stored analysis is returned for the same URL and HTML."""
+        cache = AnalysisCache(str(tmp_path / "scout.sqlite"))
+
+        assert cache.get(HTML, "https://example.com") is None
+        cache.put(HTML, "https://example.com", ANALYSIS)
+        assert cache.get(HTML, "https://example.com") == ANALYSIS
+
+    def test_changed_html_or_url_misses(self, tmp_path):
+        """The key covers both the page content and its URL."""
+        cache = AnalysisCache(str(tmp_path / "scout.sqlite"))
+        cache.put(HTML, "https://example.com", ANALYSIS)
+
+        assert cache.get(HTML + "<p>new</p>", "https://example.com") is None
+        assert cache.get(HTML, "https://example.org") is None
+        assert cache.get(HTML, None) is None
+
+    def test_key_includes_version(self):
+        """An upgraded analyzer does not reuse older results."""
+        key = AnalysisCache.make_key(HTML, "https://example.com")
+        with patch.object(analysis_cache, "__version__", "0.0.0"):
+            assert AnalysisCache.make_key(HTML, "https://example.com") != key
+
+    def test_expired_entry_misses_and_is_pruned(self, tmp_path):
+        """Entries older than the TTL are ignored and removed on the next put."""
+        db_path = tmp_path / "scout.sqlite"
+        cache = AnalysisCache(str(db_path), ttl_seconds=60)
+        cache.put(HTML, "https://example.com", ANALYSIS)
+
+        old = (datetime.now(timezone.utc) - timedelta(seconds=120)).isoformat()
+        conn = sqlite3.connect(db_path)
+        conn.execute("UPDATE analysis_cache SET created_at = ?", (old,))
+        conn.commit()
+        conn.close()
+
+        assert cache.get(HTML, "https://example.com") is None
+
+        cache.put(HTML, "https://example.org", ANALYSIS)
+        conn = sqlite3.connect(db_path)
+        count = conn.execute("SELECT COUNT(*) FROM analysis_cache").fetchone()[0]
+        conn.close()
+        assert count == 1
+
+
+class TestScoutCliCache:
+    """Tests for the scout CLI cache wiring."""
+
+    def _run(self, tmp_path, *args):
+        page = tmp_path / "page.html"
+        page.write_text(HTML, encoding="utf-8")
+        return CliRunner().invoke(scout, [str(page), "--format", "json", "--batch", *args])
+
+    def test_second_run_reuses_analysis(self, tmp_path):
+        """Re-scouting an unchanged page skips analyze_page."""
+        with (
+            patch(
+                "quarry.lib.paths.default_scout_cache_path",
+                return_value=tmp_path / "scout.sqlite",
+            ),
+            patch("quarry.tools.scout.cli.analyze_page", return_value=ANALYSIS) as analyze,
+        ):
+            first = self._run(tmp_path)
+            second = self._run(tmp_path)
+
+        assert first.exit_code == 0
+        assert second.exit_code == 0
+        assert analyze.call_count == 1
+        assert second.stdout == first.stdout
+
+    def test_no_cache_always_analyzes(self, tmp_path):
+        """--no-cache neither reads nor writes the cache."""
+        with (
+            patch(
+                "quarry.lib.paths.default_scout_cache_path",
+                return_value=tmp_path / "scout.sqlite",
+            ),
+            patch("quarry.tools.scout.cli.analyze_page", return_value=ANALYSIS) as analyze,
+        ):
+            self._run(tmp_path, "--no-cache")
+            self._run(tmp_path, "--no-cache")
+
+        assert analyze.call_count == 2
+        assert not (tmp_path / "scout.sqlite").exists()
@@ -44,7 +44,7 @@ class TestDeduplicatorComputeHash:
         hash2 = dedup._compute_hash(record)
 
         assert hash1 == hash2
-        assert len(hash1) == 64  # SHA256 hex length
+        assert 0 <= hash1 < 2**128  # Truncated SHA256 digest
 
     def test_compute_hash_different_records(self):
         """Test different records produce different hashes."""
@@ -91,7 +91,7 @@ class TestDeduplicatorComputeHash:
         hash1 = dedup._compute_hash(record)
 
         # Should not raise, missing field becomes None
-        assert len(hash1) == 64
+        assert hash1 == dedup._compute_hash({"id": 1, "missing_field": None})
 
 
 class TestDeduplicatorFirstStrategy:
@@ -6,6 +6,7 @@ from unittest.mock import patch
 import pytest
 import yaml
 
+from quarry.lib import fastjson
 from quarry.tools.excavate.executor import (
     ExcavateExecutor,
     ForgeError,
@@ -296,6 +297,20 @@ class TestWriteJsonl:
         lines = output_path.read_text(encoding="utf-8").strip().split("\n")
         assert json.loads(lines[0])["name"] == "日本語"
 
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_write_jsonl_with_and_without_orjson(self, tmp_path, monkeypatch, use_orjson):
+        """Test both encoders write the same items, including wide integers."""
+        if not use_orjson:
+            monkeypatch.setattr(fastjson, "orjson", None)
+        items = [{"id": 123456789012345678901234567890}, {"name": "émoji 🎉", "tags": ["a"]}]
+        output_path = tmp_path / "output.jsonl"
+
+        count = write_jsonl(iter(items), output_path)
+
+        assert count == 2
+        lines = output_path.read_text(encoding="utf-8").splitlines()
+        assert [json.loads(line) for line in lines] == items
+
 
 class TestAppendJsonl:
     """Tests for append_jsonl function."""
@@ -1,6 +1,7 @@
 """Tests for excavate parser module."""
 
 import pytest
+from bs4 import BeautifulSoup
 
 from quarry.lib.schemas import ExtractionSchema, FieldSchema
 from quarry.tools.excavate.parser import SchemaParser
@@ -49,6 +50,13 @@ class TestSchemaParser:
         assert results[0]["link"] == "https://example.com/1"
         assert results[1]["title"] == "Second Article"
 
+    def test_parse_soup_matches_parse(self, basic_schema, sample_html):
+        """Test parsing a pre-built tree gives the same items as parsing text."""
+        parser = SchemaParser(basic_schema)
+        soup = BeautifulSoup(sample_html, "html.parser")
+
+        assert parser.parse_soup(soup) == parser.parse(sample_html)
+
     def test_parse_empty_html(self, basic_schema):
         """Test parsing empty HTML returns empty list."""
         parser = SchemaParser(basic_schema)
@@ -0,0 +1,75 @@
+"""Tests for the shared JSON codec."""
+
+import json
+from datetime import date, datetime
+
+import pytest
+
+from quarry.lib import fastjson
+
+
+@pytest.fixture(params=[True, False], ids=["orjson", "stdlib"])
+def use_orjson(request, monkeypatch):
+    """Run a test with and without orjson."""
+    if not request.param:
+        monkeypatch.setattr(fastjson, "orjson", None)
+    return request.param
+
+
+def test_loads_matches_stdlib(use_orjson) -> None:
+    """Wide integers, NaN and non-ASCII text decode like json.loads."""
+    for line in (
+        b'{"id": 1, "name": "caf\xc3\xa9"}\r\n',
+        b'{"id": 2, "score": NaN}',
+        b'{"id": 123456789012345678901234567890}',
+        b'{"price": 12345678901234567890.5}',
+    ):
+        decoded = fastjson.loads(line)
+        expected = json.loads(line)
+        assert repr(decoded) == repr(expected)
+
+
+def test_loads_rejects_invalid(use_orjson) -> None:
+    """Invalid input raises json.JSONDecodeError either way."""
+    with pytest.raises(json.JSONDecodeError):
+        fastjson.loads(b"not json")
+
+
+def test_dumps_is_compact_and_round_trips(use_orjson) -> None:
+    """Output has no padding, keeps non-ASCII text, and round-trips."""
+    record = {"id": "001", "title": "Café", "tags": ["a", "b"], 1: "int key"}
+
+    encoded = fastjson.dumps(record)
+
+    assert encoded == '{"id":"001","title":"Café","tags":["a","b"],"1":"int key"}'
+
+
+def test_dumps_line_round_trips(use_orjson) -> None:
+    """Each line is compact, ends in a newline, and wide integers survive."""
+    items = [{"id": 123456789012345678901234567890}, {"name": "émoji 🎉", "tags": ["a"]}]
+
+    lines = [fastjson.dumps_line(item) for item in items]
+
+    assert lines == [(fastjson.dumps(item) + "\n").encode() for item in items]
+    assert lines[0] == b'{"id":123456789012345678901234567890}\n'
+    assert all(line.endswith(b"\n") and line.count(b"\n") == 1 for line in lines)
+    assert [fastjson.loads(line) for line in lines] == items
+
+
+def test_non_finite_floats_match_stdlib(use_orjson) -> None:
+    """NaN and Infinity are written as json.dumps writes them, not as null."""
+    record = {"score": float("nan"), "range": [float("inf"), -float("inf")], "n": 1.5}
+
+    assert fastjson.dumps(record) == json.dumps(record, separators=(",", ":"))
+    assert fastjson.dumps_line(record) == (fastjson.dumps(record) + "\n").encode()
+    assert fastjson.has_non_finite({"a": [{"b": float("nan")}]})
+    assert not fastjson.has_non_finite({"a": [1.5, "nan", None]})
+
+
+@pytest.mark.parametrize("value", [date(2024, 1, 2), datetime(2024, 1, 2, 3, 4)])
+def test_dates_rejected_like_stdlib(use_orjson, value) -> None:
+    """Dates raise TypeError with or without orjson, as json.dumps does."""
+    with pytest.raises(TypeError):
+        fastjson.dumps({"when": value})
+    with pytest.raises(TypeError):
+        fastjson.dumps_line({"when": value})
@@ -1,12 +1,17 @@
 """Tests for framework confidence scoring system."""
 
+from bs4 import BeautifulSoup
+
 from quarry.framework_profiles import (
+    PROFILES_BY_NAME,
+    BootstrapProfile,
     DjangoAdminProfile,
     DrupalViewsProfile,
     NextJSProfile,
     ReactComponentProfile,
     TailwindProfile,
     VueJSProfile,
+    WordPressProfile,
     detect_all_frameworks,
     detect_framework,
 )
@@ -99,6 +104,21 @@ def test_threshold_detection():
     assert score >= 40, f"Vue score should be >= 40, got {score}"
 
 
+def test_detect_framework_hint():
+    """Test a hinted profile is returned when it clears the threshold on its own."""
+    html = """
+    <script id="__NEXT_DATA__" type="application/json">{"props": {}}</script>
+    <div id="__next"><div data-reactroot="">Content</div></div>
+    """
+    assert PROFILES_BY_NAME["react"] is ReactComponentProfile
+    assert detect_framework(html) is NextJSProfile
+    assert detect_framework(html, hint="react") is ReactComponentProfile
+
+    # Hints that don't match, or aren't profile names, fall back to full detection
+    assert detect_framework(html, hint="wordpress") is NextJSProfile
+    assert detect_framework(html, hint="no-such-framework") is NextJSProfile
+
+
 def test_framework_priority():
     """Test that more specific frameworks win over generic ones."""
     # Next.js + React (Next.js should win as more specific)
@@ -179,6 +199,19 @@ def test_tailwind_pattern_counting():
     assert score2 >= 50, f"Should have high confidence with many patterns, got {score2}"
 
 
+def test_tailwind_score_brackets():
+    """Test Tailwind score thresholds, including matches late in the pattern list."""
+    assert TailwindProfile.detect('<div class="dark:x sm:x md:x">') == 0
+    assert TailwindProfile.detect('<div class="hover:x dark:x sm:x lg:x">') == 30
+    assert TailwindProfile.detect('<div class="flex grid space-y-2 gap-2 p-2 m-2">') == 50
+    assert TailwindProfile.detect('<div class="flex text-sm bg-x rounded shadow border-x">') == 50
+    all_patterns = (
+        '<div class="flex grid space-y-2 gap-2 p-2 m-2 text-sm bg-x rounded shadow '
+        'border-x hover:x dark:x sm:x md:x lg:x">'
+    )
+    assert TailwindProfile.detect(all_patterns) == 70
+
+
 def test_zero_score_filtered():
     """Test that detect_all_frameworks filters out zero scores."""
     # Plain HTML with no framework indicators
@@ -201,3 +234,18 @@ def test_react_false_positive_prevention():
     html2 = '<div id="app" data-reactroot=""><h1>My App</h1></div>'
     score2 = ReactComponentProfile.detect(html2)
     assert score2 >= 40, "Should detect React with data-reactroot"
+
+
+def test_item_classes_match_whole_names():
+    """Test item-element bonuses need an exact class, not a class-name prefix."""
+    soup = BeautifulSoup(
+        '<div class="card-title"></div><div class="shadow card"></div>'
+        '<div class="post-meta"></div><article class="post-12 post"></article>',
+        "html.parser",
+    )
+    card_title, card, post_meta, post = soup.find_all(["div", "article"])
+
+    assert BootstrapProfile.detect("", card_title) == 0
+    assert BootstrapProfile.detect("", card) == 20
+    assert WordPressProfile.detect("", post_meta) == 0
+    assert WordPressProfile.detect("", post) == 20
@@ -0,0 +1,55 @@
+"""Tests for the fetched-HTML cache."""
+
+import sqlite3
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+from quarry.lib.html_cache import HtmlCache
+
+URL = "https://example.com/news"
+HTML = "<html><body><div class='item'>Café ☕</div></body></html>"
+
+
+class TestHtmlCache:
+    """Tests for HtmlCache."""
+
+    def test_miss_then_hit(self, tmp_path):
+        """Stored HTML round-trips, including non-ASCII text."""
+        cache = HtmlCache(str(tmp_path / "html.sqlite"))
+
+        assert cache.get(URL) is None
+        cache.put(URL, HTML)
+        assert cache.get(URL) == HTML
+        assert cache.get("https://example.org") is None
+
+    def test_fetch_downloads_once(self, tmp_path):
+        """A second fetch of the same URL is served from the cache."""
+        cache = HtmlCache(str(tmp_path / "html.sqlite"))
+
+        with patch("quarry.lib.html_cache.get_html", return_value=HTML) as get_html:
+            assert cache.fetch(URL) == HTML
+            assert cache.fetch(URL) == HTML
+
+        get_html.assert_called_once_with(URL)
+
+    def test_expired_entry_is_refetched_and_pruned(self, tmp_path):
+        """Entries older than the TTL are downloaded again and old rows removed."""
+        db_path = tmp_path / "html.sqlite"
+        cache = HtmlCache(str(db_path), ttl_seconds=60)
+        cache.put(URL, HTML)
+        cache.put("https://example.org", HTML)
+
+        old = (datetime.now(timezone.utc) - timedelta(seconds=120)).isoformat()
+        conn = sqlite3.connect(db_path)
+        conn.execute("UPDATE html_cache SET fetched_at = ?", (old,))
+        conn.commit()
+        conn.close()
+
+        with patch("quarry.lib.html_cache.get_html", return_value="<p>new</p>") as get_html:
+            assert cache.fetch(URL) == "<p>new</p>"
+
+        get_html.assert_called_once_with(URL)
+        conn = sqlite3.connect(db_path)
+        urls = [row[0] for row in conn.execute("SELECT url FROM html_cache")]
+        conn.close()
+        assert urls == [URL]
@@ -1,6 +1,7 @@
 """Tests for HTTP client utilities."""
 
 import os
+import threading
 from unittest.mock import MagicMock, patch
 
 from quarry.lib.http import (
@@ -9,12 +10,75 @@ from quarry.lib.http import (
     _USER_AGENTS,
     _build_browser_headers,
     _check_robots_txt,
+    _default_session,
+    get_html_many,
     get_rate_limiter,
     set_rate_limiter,
 )
 from quarry.lib.ratelimit import DomainRateLimiter
 
 
+class TestDefaultSession:
+    """Tests for the per-thread shared session."""
+
+    def test_reused_within_thread(self):
+        """Should hand out the same session on repeated calls."""
+        assert _default_session() is _default_session()
+
+    def test_separate_per_thread(self):
+        """Should give each thread its own session."""
+        sessions = []
+        worker = threading.Thread(target=lambda: sessions.append(_default_session()))
+        worker.start()
+        worker.join()
+
+        assert sessions[0] is not _default_session()
+
+
+class TestGetHtmlMany:
+    """Tests for concurrent batch fetching."""
+
+    @patch("quarry.lib.http.get_html")
+    def test_results_in_input_order(self, mock_get_html):
+        """Should return one result per URL in the order given."""
+        mock_get_html.side_effect = lambda url, **kwargs: f"<html>{url}</html>"
+        urls = [f"https://site{i}.example.com/" for i in range(5)]
+
+        assert get_html_many(urls) == [f"<html>{url}</html>" for url in urls]
+
+    @patch("quarry.lib.http.get_html")
+    def test_failures_returned_in_place(self, mock_get_html):
+        """Should return a failed URL's exception instead of raising it."""
+        error = PermissionError("blocked")
+
+        def fake_get_html(url, **kwargs):
+            if "bad" in url:
+                raise error
+            return "ok"
+
+        mock_get_html.side_effect = fake_get_html
+
+        assert get_html_many(["https://a.com", "https://bad.com", "https://b.com"]) == [
+            "ok",
+            error,
+            "ok",
+        ]
+
+    @patch("quarry.lib.http.get_html")
+    def test_forwards_options(self, mock_get_html):
+        """Should pass fetch options through to get_html."""
+        mock_get_html.return_value = "ok"
+
+        get_html_many(["https://a.com"], timeout=5, respect_robots=False)
+
+        assert mock_get_html.call_args.kwargs["timeout"] == 5
+        assert mock_get_html.call_args.kwargs["respect_robots"] is False
+
+    def test_empty_list(self):
+        """Should return an empty list without starting workers."""
+        assert get_html_many([]) == []
+
+
 class TestRateLimiter:
     """Tests for rate limiter management."""
 
@@ -0,0 +1,35 @@
+"""Tests for lazy package re-exports."""
+
+import sys
+import types
+
+import pytest
+
+from quarry.lib.lazy import lazy_module_attrs
+
+
+@pytest.fixture
+def package(monkeypatch):
+    """A throwaway package re-exporting names from quarry.lib.paths."""
+    module = types.ModuleType("fake_pkg")
+    monkeypatch.setitem(sys.modules, "fake_pkg", module)
+    module.__getattr__, module.__dir__ = lazy_module_attrs(
+        "fake_pkg", {"get_base_dir": "quarry.lib.paths"}
+    )
+    return module
+
+
+def test_resolves_and_caches(package) -> None:
+    """A lazy name is imported on first access and then stored on the package."""
+    from quarry.lib.paths import get_base_dir  # noqa: PLC0415
+
+    assert "get_base_dir" not in vars(package)
+    assert package.get_base_dir is get_base_dir
+    assert vars(package)["get_base_dir"] is get_base_dir
+
+
+def test_unknown_name_and_dir(package) -> None:
+    """Unknown names raise AttributeError; dir() lists lazy names before loading."""
+    with pytest.raises(AttributeError, match="fake_pkg"):
+        _ = package.missing
+    assert "get_base_dir" in dir(package)
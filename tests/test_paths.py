@@ -2,11 +2,15 @@
 
 from __future__ import annotations
 
+import subprocess
+import sys
 from pathlib import Path
 
 import pytest
 
+from quarry import lib
 from quarry.lib import paths
+from quarry.lib.ratelimit import TokenBucket
 
 
 @pytest.fixture(autouse=True)
@@ -37,3 +41,24 @@ def test_output_dir_uses_env(monkeypatch, tmp_path):
     schema_path = paths.default_schema_path("example", create_dirs=True)
     assert schema_path == base / "schemas" / "example.yml"
     assert schema_path.parent.exists()
+
+
+def test_importing_paths_skips_heavy_lib_modules():
+    """quarry.lib.paths should not load requests or questionary via quarry.lib."""
+    code = (
+        "import sys, quarry.lib.paths; "
+        "print('requests' in sys.modules, 'questionary' in sys.modules)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.split() == ["False", "False"]
+
+
+def test_lib_reexports_resolve_lazily():
+    """Names in quarry.lib.__all__ should still resolve on access."""
+    for name in lib.__all__:
+        assert getattr(lib, name) is not None
+    assert lib.TokenBucket is TokenBucket
+    with pytest.raises(AttributeError):
+        _ = lib.not_a_real_name
@@ -4,6 +4,10 @@ import json
 from pathlib import Path
 from tempfile import TemporaryDirectory
 
+import pytest
+
+from quarry.tools import polish
+from quarry.tools.polish.cli import _SNIFF_WINDOW, _read_first_line
 from quarry.tools.polish.deduplicator import Deduplicator
 from quarry.tools.polish.processor import PolishProcessor
 from quarry.tools.polish.transformers import (
@@ -385,3 +389,39 @@ class TestIntegration:
                 assert record1["title"] == "Item 1"
                 assert record1["url"] == "example.com"
                 assert record1["description"] == "HTML content"
+
+
+class TestPackageExports:
+    """Test lazy package-level re-exports."""
+
+    def test_reexports_resolve(self):
+        """Names in __all__ should resolve to the submodule objects."""
+        for name in polish.__all__:
+            assert getattr(polish, name) is not None
+        assert polish.Deduplicator is Deduplicator
+        assert polish.parse_date is parse_date
+
+    def test_unknown_attribute_raises(self):
+        """Unknown names should raise AttributeError."""
+        with pytest.raises(AttributeError):
+            _ = polish.not_a_real_name
+
+
+class TestReadFirstLine:
+    """Test first-record sniffing used by the interactive CLI."""
+
+    @pytest.mark.parametrize(
+        "content",
+        [
+            b"",
+            b'{"a": 1}',
+            b'{"a": 1}\n{"b": 2}\n',
+            b'{"a": "' + b"x" * _SNIFF_WINDOW + b'"}\n{"b": 2}\n',
+        ],
+    )
+    def test_returns_first_line(self, tmp_path, content):
+        """First line is returned for empty, short and window-sized lines."""
+        path = tmp_path / "data.jsonl"
+        path.write_bytes(content)
+
+        assert _read_first_line(path).strip() == content.split(b"\n")[0]
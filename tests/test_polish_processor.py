@@ -2,6 +2,9 @@
 
 import json
 
+import pytest
+
+from quarry.lib import fastjson
 from quarry.tools.polish.processor import PolishProcessor
 
 
@@ -44,6 +47,24 @@ class TestPolishProcessorBasic:
         output_lines = output_file.read_text().strip().split("\n")
         assert len(output_lines) == 2
 
+    def test_process_in_place(self, tmp_path):
+        """Test output may be the input file itself."""
+        data_file = tmp_path / "data.jsonl"
+        records = [{"id": 1, "name": " Alice "}, {"id": 1, "name": " Alice "}, {"id": 2}]
+        data_file.write_text("\n".join(json.dumps(r) for r in records))
+
+        processor = PolishProcessor()
+        stats = processor.process(
+            data_file,
+            data_file,
+            deduplicate=True,
+            transformations={"name": [{"transform": "clean_whitespace"}]},
+        )
+
+        assert stats["records_written"] == 2
+        output_records = [json.loads(line) for line in data_file.read_text().splitlines()]
+        assert output_records == [{"id": 1, "name": "Alice"}, {"id": 2}]
+
     def test_process_skips_empty_lines(self, tmp_path):
         """Test processor skips empty lines in input."""
         input_file = tmp_path / "input.jsonl"
@@ -71,6 +92,30 @@ class TestPolishProcessorBasic:
         assert stats["records_skipped"] == 1
         assert stats["records_written"] == 2
 
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_process_decodes_lines_with_and_without_orjson(self, tmp_path, monkeypatch, use_orjson):
+        """Test CRLF lines, NaN and big integers decode like json.loads."""
+        if not use_orjson:
+            monkeypatch.setattr(fastjson, "orjson", None)
+
+        input_file = tmp_path / "input.jsonl"
+        output_file = tmp_path / "output.jsonl"
+        input_file.write_bytes(
+            b'{"id": 1, "name": "caf\xc3\xa9"}\r\n'
+            b'{"id": 2, "score": NaN}\r\n'
+            b'{"id": 123456789012345678901234567890}\n'
+            b"not json\n"
+        )
+
+        processor = PolishProcessor()
+        stats = processor.process(input_file, output_file)
+
+        assert stats["records_read"] == 3
+        assert stats["records_skipped"] == 1
+        lines = output_file.read_text().splitlines()
+        assert json.loads(lines[0]) == {"id": 1, "name": "café"}
+        assert json.loads(lines[2]) == {"id": 123456789012345678901234567890}
+
     def test_process_creates_output_directory(self, tmp_path):
         """Test processor creates output directory if missing."""
         input_file = tmp_path / "input.jsonl"
@@ -189,6 +234,38 @@ class TestPolishProcessorTransformations:
         output = json.loads(output_file.read_text().strip())
         assert output["date"] is None
 
+    def test_mixed_value_types_keep_per_record_semantics(self, tmp_path):
+        """Test columns mixing strings and other values across batches."""
+        input_file = tmp_path / "input.jsonl"
+        output_file = tmp_path / "output.jsonl"
+
+        records = [
+            {"text": "  <b>Héllo</b>  world "},
+            {"text": 42},
+            {"text": None},
+            {"other": "untouched"},
+            {"text": "  plain   ascii  "},
+        ]
+        input_file.write_text("\n".join(json.dumps(r) for r in records))
+
+        processor = PolishProcessor()
+        processor.BATCH_SIZE = 2
+        stats = processor.process(
+            input_file,
+            output_file,
+            transformations={"text": [{"transform": "strip_html"}, {"transform": "uppercase"}]},
+        )
+
+        assert stats["records_read"] == 5
+        output = [json.loads(line) for line in output_file.read_text().splitlines()]
+        assert output == [
+            {"text": "HÉLLO WORLD"},
+            {"text": 42},
+            {"text": None},
+            {"other": "untouched"},
+            {"text": "PLAIN ASCII"},
+        ]
+
 
 class TestPolishProcessorDeduplication:
     """Tests for deduplication functionality."""
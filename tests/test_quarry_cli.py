@@ -0,0 +1,31 @@
+"""Tests for the top-level quarry CLI group."""
+
+from click.testing import CliRunner
+
+from quarry.quarry import LAZY_COMMANDS, quarry
+
+
+class TestLazyCommands:
+    """Tool subcommands should resolve on demand."""
+
+    def test_help_lists_all_commands(self):
+        """Lazy and eagerly defined commands should all appear in --help."""
+        result = CliRunner().invoke(quarry, ["--help"])
+
+        assert result.exit_code == 0
+        for name in [*LAZY_COMMANDS, "run", "miner"]:
+            assert name in result.output
+
+    def test_lazy_command_resolves_on_lookup(self):
+        """Looking up a tool should import and register its command."""
+        result = CliRunner().invoke(quarry, ["ship", "--help"])
+
+        assert result.exit_code == 0
+        assert "ship" in quarry.commands
+
+    def test_unknown_command_errors(self):
+        """Unknown names should still produce click's usage error."""
+        result = CliRunner().invoke(quarry, ["not-a-tool"])
+
+        assert result.exit_code != 0
+        assert "No such command" in result.output
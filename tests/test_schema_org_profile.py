@@ -0,0 +1,79 @@
+"""Tests for quarry/framework_profiles/universal/schema_org.py."""
+
+from quarry.framework_profiles.universal.schema_org import SchemaOrgProfile
+
+
+class TestSchemaOrgJsonLd:
+    """Tests for JSON-LD script extraction."""
+
+    def test_extracts_objects_and_arrays(self):
+        """Test single objects and top-level arrays are both flattened."""
+        html = """
+        <script type="application/ld+json">{"@type": "Article", "headline": "One"}</script>
+        <script type='application/ld+json'>[{"@type": "Person"}, {"@type": "Event"}]</script>
+        """
+        blocks = SchemaOrgProfile._extract_json_ld(html)
+        assert [block["@type"] for block in blocks] == ["Article", "Person", "Event"]
+
+    def test_attribute_forms(self):
+        """Test unquoted, uppercase and multi-attribute script tags are found."""
+        html = """
+        <script type=application/ld+json>{"n": 1}</script>
+        <SCRIPT id="meta" TYPE="application/ld+json">{"n": 2}</SCRIPT >
+        <script type="application/ld+json"
+                data-x="1">
+            {"n": 3}
+        </script>
+        """
+        assert [block["n"] for block in SchemaOrgProfile._extract_json_ld(html)] == [1, 2, 3]
+
+    def test_skips_other_scripts_and_bad_json(self):
+        """Test other script types, empty blocks and malformed JSON are ignored."""
+        html = """
+        <script type="text/javascript">var t = "application/ld+json";</script>
+        <script type="application/ld+jsonx">{"n": 0}</script>
+        <script type="application/ld+json"></script>
+        <script type="application/ld+json">{broken</script>
+        <script type="application/ld+json">{"n": 1}</script>
+        """
+        assert SchemaOrgProfile._extract_json_ld(html) == [{"n": 1}]
+
+    def test_skips_commented_out_blocks(self):
+        """Test JSON-LD inside HTML comments is ignored, but "<!--" in scripts is not a comment."""
+        html = """
+        <!-- <script type="application/ld+json">{"n": 0}</script> -->
+        <script type="application/ld+json">{"n": 1}</script>
+        <script>document.write("<!--");</script>
+        <script type="application/ld+json">{"n": 2}</script>
+        <!-- unterminated <script type="application/ld+json">{"n": 3}</script>
+        """
+        assert SchemaOrgProfile._extract_json_ld(html) == [{"n": 1}, {"n": 2}]
+
+    def test_detect_scores_json_ld(self):
+        """Test a JSON-LD block scores above the detection threshold."""
+        html = '<script type="application/ld+json">{"@type":"NewsArticle"}</script>'
+        assert SchemaOrgProfile.detect(html) >= 50
+
+    def test_extract_json_ld_fields(self):
+        """Test standard field names are read from JSON-LD properties."""
+        html = """
+        <script type="application/ld+json">
+        {"@type": "Article", "headline": "Test", "author": {"name": "Ada"}}
+        </script>
+        """
+        fields = SchemaOrgProfile.extract_json_ld_fields(html)
+        assert fields["title"] == "Test"
+        assert fields["author"] == "Ada"
+
+
+class TestSchemaOrgDetect:
+    """Tests for SchemaOrgProfile.detect scoring."""
+
+    def test_plain_page_scores_zero(self):
+        """Test a page without structured data is not detected."""
+        assert SchemaOrgProfile.detect("<html><body><p>Hello</p></body></html>") == 0
+
+    def test_type_bonus_from_url_or_json(self):
+        """Test the type bonus applies to schema.org URLs and inline @type JSON."""
+        assert SchemaOrgProfile.detect('<a href="https://schema.org/Product">') == 15
+        assert SchemaOrgProfile.detect('<script>var d = {"@type":"Event"};</script>') == 10
@@ -2,11 +2,24 @@
 
 import csv
 import json
+import math
 import sqlite3
+from collections import Counter
+from unittest.mock import MagicMock, patch
 
+import pyarrow.parquet as pq
 import pytest
 
-from quarry.tools.ship.exporters import CSVExporter, JSONExporter, SQLiteExporter
+import quarry.sinks.postgres as postgres_module
+from quarry.sinks.postgres import PostgresConnectionError, PostgresSink
+from quarry.tools.ship import exporters as exporters_module
+from quarry.tools.ship.exporters import (
+    CSVExporter,
+    JSONExporter,
+    ParquetExporter,
+    PostgresExporter,
+    SQLiteExporter,
+)
 
 
 class TestCSVExporter:
@@ -132,6 +145,86 @@ class TestCSVExporter:
         assert "title" in fieldnames
         assert "author" in fieldnames
 
+    def test_export_counts_records_once(self, tmp_path):
+        """Test the header pre-scan does not double count records."""
+        jsonl_path = tmp_path / "input.jsonl"
+        jsonl_path.write_text('{"id": "1"}\nnot json\n{"id": "2"}\n', encoding="utf-8")
+
+        output_path = tmp_path / "output.csv"
+        exporter = CSVExporter(str(output_path))
+
+        stats = exporter.export(jsonl_path)
+
+        assert stats["records_read"] == 2
+        assert stats["records_failed"] == 1
+        assert stats["records_written"] == 2
+
+    def test_export_counts_unencodable_rows_as_failed(self, tmp_path):
+        """Test a row the output encoding cannot hold fails on its own."""
+        jsonl_path = tmp_path / "input.jsonl"
+        jsonl_path.write_text(
+            '{"name": "plain"}\n{"name": "snow \\u2603"}\n{"name": "caf\\u00e9"}\n',
+            encoding="utf-8",
+        )
+
+        output_path = tmp_path / "output.csv"
+        stats = CSVExporter(str(output_path), encoding="latin-1").export(jsonl_path)
+
+        assert stats["records_written"] == 2
+        assert stats["records_failed"] == 1
+        assert output_path.read_text(encoding="latin-1").splitlines() == [
+            "name",
+            "plain",
+            "caf\u00e9",
+        ]
+
+    def test_export_explicit_headers(self, tmp_path, sample_jsonl):
+        """Test export uses the given headers in order."""
+        output_path = tmp_path / "output.csv"
+        exporter = CSVExporter(str(output_path), headers=["title", "id", "_meta"])
+
+        stats = exporter.export(sample_jsonl)
+
+        assert stats["records_read"] == 2
+        with output_path.open(encoding="utf-8") as f:
+            reader = csv.DictReader(f)
+            rows = list(reader)
+
+        assert reader.fieldnames == ["title", "id"]
+        assert rows[1] == {"title": "Second", "id": "2"}
+
+    def test_export_with_workers_matches_serial(self, tmp_path, monkeypatch):
+        """Test a multi-process export writes the same file as a serial one."""
+        monkeypatch.setattr(CSVExporter, "PARALLEL_MIN_BYTES", 0)
+        monkeypatch.setattr(CSVExporter, "PARALLEL_RANGE_BYTES", 128)
+        jsonl_path = tmp_path / "input.jsonl"
+        records = [{"id": str(i), "tags": ["a", i], "note": None} for i in range(40)]
+        jsonl_path.write_text("\n".join(json.dumps(r) for r in records), encoding="utf-8")
+
+        serial_path = tmp_path / "serial.csv"
+        parallel_path = tmp_path / "parallel.csv"
+        CSVExporter(str(serial_path)).export(jsonl_path)
+        stats = CSVExporter(str(parallel_path), workers=2).export(jsonl_path)
+
+        assert parallel_path.read_bytes() == serial_path.read_bytes()
+        assert stats["records_written"] == 40
+
+    def test_export_first_seen_column_order(self, tmp_path):
+        """Test sort_columns=False keeps columns in first-seen order."""
+        jsonl_path = tmp_path / "input.jsonl"
+        records = [{"title": "First", "id": "1"}, {"id": "2", "author": "Bob"}]
+        jsonl_path.write_text("\n".join(json.dumps(r) for r in records), encoding="utf-8")
+
+        output_path = tmp_path / "output.csv"
+        CSVExporter(str(output_path), sort_columns=False).export(jsonl_path)
+
+        with output_path.open(encoding="utf-8") as f:
+            reader = csv.DictReader(f)
+            rows = list(reader)
+
+        assert reader.fieldnames == ["title", "id", "author"]
+        assert rows[1] == {"title": "", "id": "2", "author": "Bob"}
+
 
 class TestJSONExporter:
     """Tests for JSONExporter class."""
@@ -208,6 +301,56 @@ class TestJSONExporter:
             data = json.load(f)
         assert data == []
 
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    @pytest.mark.parametrize("pretty", [True, False])
+    def test_export_with_and_without_orjson(self, tmp_path, monkeypatch, use_orjson, pretty):
+        """Test both encoders write the same data."""
+        if not use_orjson:
+            monkeypatch.setattr(exporters_module, "orjson", None)
+        jsonl_path = tmp_path / "input.jsonl"
+        records = [
+            {"id": 1, "title": "Café"},
+            {"id": 2, "tags": ["a", "b"]},
+            {"id": 3, "score": float("nan"), "range": [float("inf"), -float("inf")]},
+        ]
+        jsonl_path.write_text("\n".join(json.dumps(r) for r in records), encoding="utf-8")
+
+        output_path = tmp_path / "output.json"
+        JSONExporter(str(output_path), pretty=pretty).export(jsonl_path)
+
+        text = output_path.read_text(encoding="utf-8")
+        data = json.loads(text)
+        assert data[:2] == records[:2]
+        assert math.isnan(data[2]["score"])
+        assert data[2]["range"] == [float("inf"), -float("inf")]
+        assert "null" not in text
+
+    @pytest.mark.parametrize("indent", [None, 2, 4])
+    def test_export_streams_standard_layout(self, tmp_path, monkeypatch, indent):
+        """Test the streamed array is laid out exactly as json.dump lays out a list."""
+        monkeypatch.setattr(exporters_module, "orjson", None)
+        jsonl_path = tmp_path / "input.jsonl"
+        records = [{"id": 1, "nested": {"tags": ["a"]}}, {"id": 2, "title": "Caf\u00e9"}]
+        jsonl_path.write_text("\n".join(json.dumps(r) for r in records), encoding="utf-8")
+
+        output_path = tmp_path / "output.json"
+        options = {"pretty": True, "indent": indent} if indent else {}
+        JSONExporter(str(output_path), **options).export(jsonl_path)
+
+        assert output_path.read_text(encoding="utf-8") == json.dumps(records, indent=indent)
+
+    def test_export_keeps_wide_integers(self, tmp_path):
+        """Test integers wider than 64 bits survive the export."""
+        jsonl_path = tmp_path / "input.jsonl"
+        jsonl_path.write_text('{"id": 123456789012345678901234567890}', encoding="utf-8")
+
+        output_path = tmp_path / "output.json"
+        JSONExporter(str(output_path)).export(jsonl_path)
+
+        assert json.loads(output_path.read_text(encoding="utf-8")) == [
+            {"id": 123456789012345678901234567890}
+        ]
+
 
 class TestSQLiteExporter:
     """Tests for SQLiteExporter class."""
@@ -355,6 +498,312 @@ class TestSQLiteExporter:
 
         assert value == '["a", "b"]'
 
+    def test_export_counts_failed_rows_in_chunk(self, tmp_path, monkeypatch):
+        """Test a failing row only fails itself, not its whole chunk."""
+        monkeypatch.setattr(SQLiteExporter, "CHUNK_SIZE", 2)
+        jsonl_path = tmp_path / "input.jsonl"
+        records = [{"id": "1"}, {"id": "2"}, {"id": "2"}, {"id": "3"}, {"id": "4"}]
+        jsonl_path.write_text("\n".join(json.dumps(r) for r in records), encoding="utf-8")
+
+        db_path = tmp_path / "output.db"
+        conn = sqlite3.connect(db_path)
+        conn.execute('CREATE TABLE records ("id" TEXT UNIQUE)')
+        conn.close()
+
+        exporter = SQLiteExporter(str(db_path), if_exists="append")
+        stats = exporter.export(jsonl_path)
+
+        conn = sqlite3.connect(db_path)
+        ids = [row[0] for row in conn.execute("SELECT id FROM records ORDER BY id")]
+        conn.close()
+
+        assert stats["records_written"] == 4
+        assert stats["records_failed"] == 1
+        assert ids == ["1", "2", "3", "4"]
+
+    def test_export_bisects_chunk_to_failing_rows(self, tmp_path, monkeypatch):
+        """Test scattered failures in one chunk are isolated without losing rows."""
+        monkeypatch.setattr(SQLiteExporter, "CHUNK_SIZE", 16)
+        jsonl_path = tmp_path / "input.jsonl"
+        ids = [str(i) for i in range(20)] + ["3", "11", "19"]
+        jsonl_path.write_text("\n".join(json.dumps({"id": i}) for i in ids), encoding="utf-8")
+
+        db_path = tmp_path / "output.db"
+        conn = sqlite3.connect(db_path)
+        conn.execute('CREATE TABLE records ("id" TEXT UNIQUE)')
+        conn.close()
+
+        stats = SQLiteExporter(str(db_path), if_exists="append").export(jsonl_path)
+
+        conn = sqlite3.connect(db_path)
+        count = conn.execute("SELECT COUNT(*) FROM records").fetchone()[0]
+        conn.close()
+
+        assert stats["records_written"] == 20
+        assert stats["records_failed"] == 3
+        assert count == 20
+
+    def test_export_counts_records_once(self, tmp_path, sample_jsonl):
+        """Test the schema pre-scan does not double count records."""
+        db_path = tmp_path / "output.db"
+        exporter = SQLiteExporter(str(db_path))
+
+        stats = exporter.export(sample_jsonl)
+
+        assert stats["records_read"] == 2
+        assert stats["records_written"] == 2
+
+    def test_export_explicit_schema(self, tmp_path, sample_jsonl):
+        """Test export creates only the given columns."""
+        db_path = tmp_path / "output.db"
+        exporter = SQLiteExporter(str(db_path), schema=["title", "id"])
+
+        stats = exporter.export(sample_jsonl)
+
+        conn = sqlite3.connect(db_path)
+        columns = [row[1] for row in conn.execute("PRAGMA table_info(records)")]
+        rows = conn.execute("SELECT title, id FROM records").fetchall()
+        conn.close()
+
+        assert stats["records_read"] == 2
+        assert columns == ["title", "id"]
+        assert rows == [("First", "1"), ("Second", "2")]
+
+    def test_export_first_seen_column_order(self, tmp_path, sample_jsonl):
+        """Test sort_columns=False keeps columns in first-seen order."""
+        db_path = tmp_path / "output.db"
+        SQLiteExporter(str(db_path), sort_columns=False).export(sample_jsonl)
+
+        conn = sqlite3.connect(db_path)
+        columns = [row[1] for row in conn.execute("PRAGMA table_info(records)")]
+        conn.close()
+
+        assert columns == ["id", "title", "author"]
+
+
+class TestParquetExporter:
+    """Tests for ParquetExporter class."""
+
+    def test_export_infers_column_types(self, tmp_path):
+        """Test columns get Arrow types that hold every value losslessly."""
+        jsonl_path = tmp_path / "input.jsonl"
+        records = [
+            {"id": 1, "price": 9.5, "ok": True, "name": "A", "tags": ["x"], "_meta": {}},
+            {"id": 2, "price": 10, "ok": False, "name": 7, "tags": None},
+        ]
+        jsonl_path.write_text("\n".join(json.dumps(r) for r in records), encoding="utf-8")
+        output_path = tmp_path / "output.parquet"
+
+        stats = ParquetExporter(str(output_path)).export(jsonl_path)
+
+        assert stats["records_written"] == 2
+        table = pq.read_table(output_path)
+        types = {field.name: str(field.type) for field in table.schema}
+        assert types == {
+            "id": "int64",
+            "name": "string",
+            "ok": "bool",
+            "price": "double",
+            "tags": "string",
+        }
+        assert table.to_pylist() == [
+            {"id": 1, "name": "A", "ok": True, "price": 9.5, "tags": '["x"]'},
+            {"id": 2, "name": "7", "ok": False, "price": 10.0, "tags": None},
+        ]
+
+    def test_export_keeps_integers_float64_cannot_hold(self, tmp_path):
+        """Test large integers never widen into a lossy float column."""
+        jsonl_path = tmp_path / "input.jsonl"
+        jsonl_path.write_text(
+            '{"n": 9007199254740993}\n{"n": 1.5}\n{"m": 9007199254740993}\n{"m": 1}\n',
+            encoding="utf-8",
+        )
+        output_path = tmp_path / "output.parquet"
+
+        ParquetExporter(str(output_path)).export(jsonl_path)
+
+        table = pq.read_table(output_path)
+        assert str(table.schema.field("n").type) == "string"
+        assert str(table.schema.field("m").type) == "int64"
+        assert table.column("n").to_pylist() == ["9007199254740993", "1.5", None, None]
+        assert table.column("m").to_pylist() == [None, None, 9007199254740993, 1]
+
+    def test_export_counts_records_once(self, tmp_path):
+        """Test the type pass and the write pass count each line once."""
+        jsonl_path = tmp_path / "input.jsonl"
+        jsonl_path.write_text('{"id": 1}\nnot json\n[1, 2]\n{"id": 2}\n', encoding="utf-8")
+        output_path = tmp_path / "output.parquet"
+
+        stats = ParquetExporter(str(output_path)).export(jsonl_path)
+
+        assert stats == {"records_read": 3, "records_written": 2, "records_failed": 2}
+        assert pq.read_table(output_path).column("id").to_pylist() == [1, 2]
+
+    def test_export_row_groups_and_compression(self, tmp_path, monkeypatch):
+        """Test rows are written in row groups with the chosen codec."""
+        monkeypatch.setattr(ParquetExporter, "ROW_GROUP_SIZE", 2)
+        jsonl_path = tmp_path / "input.jsonl"
+        jsonl_path.write_text("\n".join(json.dumps({"id": i}) for i in range(5)), encoding="utf-8")
+        output_path = tmp_path / "output.parquet"
+
+        ParquetExporter(str(output_path), compression="snappy").export(jsonl_path)
+
+        metadata = pq.ParquetFile(output_path).metadata
+        assert metadata.num_row_groups == 3
+        assert metadata.row_group(0).column(0).compression == "SNAPPY"
+        assert pq.read_table(output_path).column("id").to_pylist() == [0, 1, 2, 3, 4]
+
+    def test_export_empty_file_writes_nothing(self, tmp_path):
+        """Test an input without records leaves no output file."""
+        jsonl_path = tmp_path / "input.jsonl"
+        jsonl_path.write_text("", encoding="utf-8")
+        output_path = tmp_path / "output.parquet"
+
+        stats = ParquetExporter(str(output_path)).export(jsonl_path)
+
+        assert stats["records_written"] == 0
+        assert not output_path.exists()
+
+
+class TestPostgresExporter:
+    """Tests for PostgresExporter class (psycopg is mocked)."""
+
+    @pytest.fixture
+    def sample_jsonl(self, tmp_path):
+        """Create sample JSONL input file."""
+        jsonl_path = tmp_path / "input.jsonl"
+        records = [
+            {"id": "1", "title": "First", "tags": ["a"]},
+            {"id": "2", "title": None, "_meta": {"url": "http://example.com"}},
+        ]
+        jsonl_path.write_text("\n".join(json.dumps(r) for r in records), encoding="utf-8")
+        return jsonl_path
+
+    @pytest.fixture
+    def mock_conn(self):
+        """Connection mock on which the target table does not exist."""
+        conn = MagicMock()
+        conn.cursor.return_value.fetchone.return_value = (False,)
+        return conn
+
+    def test_export_appends_with_copy(self, sample_jsonl, mock_conn):
+        """Test rows are streamed through COPY rather than INSERTs."""
+        exporter = PostgresExporter("postgresql://localhost/db", connection=mock_conn)
+
+        stats = exporter.export(sample_jsonl)
+
+        cursor = mock_conn.cursor.return_value
+        copy = cursor.copy.return_value.__enter__.return_value
+        assert [c.args[0] for c in copy.write_row.call_args_list] == [
+            ["1", '["a"]', "First"],
+            ["2", None, None],
+        ]
+        assert stats["records_read"] == 2
+        assert stats["records_written"] == 2
+        mock_conn.commit.assert_called_once()
+
+    def test_export_upsert_uses_pipelined_executemany(self, sample_jsonl, mock_conn):
+        """Test upserts send every row through one pipelined executemany."""
+        cursor = mock_conn.cursor.return_value
+        sent: list = []
+        cursor.executemany.side_effect = lambda query, rows: sent.extend(rows)
+        exporter = PostgresExporter(
+            "postgresql://localhost/db", upsert_key="id", connection=mock_conn
+        )
+
+        stats = exporter.export(sample_jsonl)
+
+        cursor.copy.assert_not_called()
+        mock_conn.pipeline.assert_called_once()
+        assert cursor.executemany.call_count == 1
+        assert sent == [["1", '["a"]', "First"], ["2", None, None]]
+        assert stats["records_written"] == 2
+
+    def test_export_rolls_back_caller_connection_on_error(self, sample_jsonl, mock_conn):
+        """Test a failed load leaves a caller-owned connection usable."""
+        mock_conn.cursor.return_value.copy.side_effect = RuntimeError("boom")
+        exporter = PostgresExporter("postgresql://localhost/db", connection=mock_conn)
+
+        with pytest.raises(RuntimeError):
+            exporter.export(sample_jsonl)
+
+        mock_conn.rollback.assert_called_once()
+        mock_conn.close.assert_not_called()
+
+    def test_export_uses_shared_pool(self, sample_jsonl, mock_conn):
+        """Test exports without a connection borrow one from get_pg_pool."""
+        pool = MagicMock()
+        pool.connection.return_value.__enter__.return_value = mock_conn
+        with patch.object(exporters_module, "get_pg_pool", return_value=pool) as get_pool:
+            PostgresExporter("postgresql://localhost/db").export(sample_jsonl)
+
+        get_pool.assert_called_once_with("postgresql://localhost/db")
+        mock_conn.commit.assert_called_once()
+
+
+class TestGetPgPool:
+    """Tests for get_pg_pool."""
+
+    @pytest.fixture(autouse=True)
+    def clear_pools(self, monkeypatch):
+        """Start each test with no cached pools."""
+        monkeypatch.setattr(postgres_module, "_POOLS", {})
+        monkeypatch.setattr(postgres_module, "_POOL_REFS", Counter())
+        exporters_module.get_pg_pool.cache_clear()
+        yield
+        exporters_module.get_pg_pool.cache_clear()
+
+    def test_reuses_pool_per_dsn(self, monkeypatch):
+        """Test one pool is created per connection string."""
+        monkeypatch.setenv("QUARRY_PG_POOL", "7")
+        with (
+            patch("psycopg.connect") as connect,
+            patch("psycopg_pool.ConnectionPool") as pool_cls,
+        ):
+            first = exporters_module.get_pg_pool("postgresql://localhost/db")
+            second = exporters_module.get_pg_pool("postgresql://localhost/db")
+
+        assert first is second
+        connect.assert_called_once()
+        pool_cls.assert_called_once_with(
+            "postgresql://localhost/db", min_size=1, max_size=7, timeout=30, open=True
+        )
+
+    def test_shares_pool_with_sink(self):
+        """Test exports and sinks for one database use the same pool."""
+        url = "postgresql://localhost/db"
+        with patch("psycopg.connect"), patch("psycopg_pool.ConnectionPool") as pool_cls:
+            pool_cls.return_value.configure_mock(min_size=1, max_size=4)
+            pool = exporters_module.get_pg_pool(url)
+            sink = PostgresSink(connection_string=url)
+            assert sink._get_pool() is pool
+
+        pool.resize.assert_called_once_with(min_size=1, max_size=5)
+
+        # The export's reference keeps the pool open after the sink closes
+        sink.close()
+        pool.close.assert_not_called()
+        assert postgres_module._POOLS == {url: pool}
+        pool_cls.assert_called_once()
+
+    def test_invalid_pool_size_uses_default(self, monkeypatch):
+        """Test a non-numeric QUARRY_PG_POOL falls back to the default size."""
+        monkeypatch.setenv("QUARRY_PG_POOL", "many")
+        with patch("psycopg.connect"), patch("psycopg_pool.ConnectionPool") as pool_cls:
+            exporters_module.get_pg_pool("postgresql://localhost/db")
+
+        assert pool_cls.call_args.kwargs["max_size"] == 4
+
+    def test_connect_failure_raises_helpful_error(self):
+        """Test connect failures surface as PostgresConnectionError."""
+        with (
+            patch("psycopg.connect", side_effect=Exception("password authentication failed")),
+            pytest.raises(PostgresConnectionError, match="authentication failed"),
+        ):
+            exporters_module.get_pg_pool("postgresql://bad@localhost/db")
+
+        assert postgres_module._POOLS == {}
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -1,10 +1,23 @@
 """Tests for state management."""
 
+import json
 import sqlite3
 import tempfile
 from pathlib import Path
 
-from quarry.state import load_cursor, save_cursor, upsert_items
+import pytest
+
+from quarry.state import (
+    _ID_LOOKUP_CHUNK,
+    _get_conn,
+    _initialized,
+    _write_transaction,
+    close_db,
+    load_cursor,
+    open_db,
+    save_cursor,
+    upsert_items,
+)
 
 # Test constants
 EXPECTED_NEW_COUNT_FIRST = 2
@@ -48,6 +61,43 @@ def test_upsert_items_deduplication() -> None:
         Path(db_path).unlink(missing_ok=True)
 
 
+def test_upsert_items_keeps_first_seen_and_last_payload() -> None:
+    """Updates keep first_seen; repeated ids within a batch keep the last payload."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = str(Path(tmpdir) / "state.sqlite")
+
+        assert upsert_items("test_job", [{"id": "001", "title": "v1"}], db_path=db_path) == 1
+        conn = _get_conn(db_path)
+        first_seen = conn.execute("SELECT first_seen FROM items WHERE id = '001'").fetchone()[0]
+
+        records = [
+            {"id": "001", "title": "v2"},
+            {"id": "002", "title": "a"},
+            {"id": "002", "title": "b"},
+            {"title": "no id"},
+        ]
+        assert upsert_items("test_job", records, db_path=db_path) == 1
+
+        rows = conn.execute("SELECT payload_json, first_seen FROM items ORDER BY id").fetchall()
+        assert [json.loads(r["payload_json"])["title"] for r in rows] == ["v2", "b"]
+        assert rows[0]["first_seen"] == first_seen
+        close_db(db_path)
+
+
+def test_upsert_items_counts_across_lookup_chunks() -> None:
+    """New-row counts stay exact when the batch spans several id lookups and jobs share ids."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = str(Path(tmpdir) / "state.sqlite")
+        size = _ID_LOOKUP_CHUNK * 2 + 5
+        all_ids = [{"id": i} for i in range(size)]
+        even_ids = all_ids[::2]
+
+        assert upsert_items("other_job", all_ids, db_path=db_path) == size
+        assert upsert_items("test_job", even_ids, db_path=db_path) == len(even_ids)
+        assert upsert_items("test_job", all_ids, db_path=db_path) == size - len(even_ids)
+        close_db(db_path)
+
+
 def test_cursor_save_load() -> None:
     """Test cursor save and load functionality."""
     with tempfile.NamedTemporaryFile(suffix=".sqlite", delete=False) as f:
@@ -70,3 +120,78 @@ def test_cursor_save_load() -> None:
 
     finally:
         Path(db_path).unlink(missing_ok=True)
+
+
+def test_connection_is_reused_until_closed() -> None:
+    """Calls for the same path share one connection until close_db."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = str(Path(tmpdir) / "state.sqlite")
+
+        conn = _get_conn(db_path)
+        save_cursor("test_job", "cursor-1", db_path=db_path)
+        assert _get_conn(db_path) is conn
+
+        close_db(db_path)
+        assert _get_conn(db_path) is not conn
+        assert load_cursor("test_job", db_path=db_path) == "cursor-1"
+        close_db(db_path)
+
+
+def test_connection_reopened_when_file_removed() -> None:
+    """A deleted database file is recreated instead of writing to a stale handle."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = str(Path(tmpdir) / "state.sqlite")
+
+        save_cursor("test_job", "cursor-1", db_path=db_path)
+        Path(db_path).unlink()
+
+        assert load_cursor("test_job", db_path=db_path) is None
+        assert Path(db_path).exists()
+        close_db(db_path)
+
+
+def test_open_db_creates_schema_once_per_path() -> None:
+    """Schema setup is skipped for known paths but redone for a new file."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = str(Path(tmpdir) / "nested" / "state.sqlite")
+
+        open_db(db_path).close()
+        assert db_path in _initialized
+
+        Path(db_path).unlink()
+        conn = open_db(db_path)
+        tables = {row[0] for row in conn.execute("SELECT name FROM sqlite_master")}
+        conn.close()
+        assert {"jobs_state", "items", "failed_urls"} <= tables
+
+
+def test_open_db_indexes_and_page_size() -> None:
+    """New databases get the job indexes and the larger page size."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = str(Path(tmpdir) / "state.sqlite")
+
+        conn = open_db(db_path)
+        indexes = {
+            row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type='index'")
+        }
+        page_size = conn.execute("PRAGMA page_size").fetchone()[0]
+        conn.close()
+
+        assert {"idx_items_job_last_seen", "idx_failed_urls_job_last_attempt"} <= indexes
+        assert page_size == 8192
+
+
+def test_write_transaction_rolls_back_on_error() -> None:
+    """A failing write block leaves no partial rows and the connection usable."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = str(Path(tmpdir) / "state.sqlite")
+        conn = _get_conn(db_path)
+
+        with pytest.raises(RuntimeError), _write_transaction(conn):
+            conn.execute("INSERT INTO items (job, id) VALUES ('test_job', '001')")
+            raise RuntimeError("boom")
+
+        assert not conn.in_transaction
+        assert conn.execute("SELECT COUNT(*) FROM items").fetchone()[0] == 0
+        assert upsert_items("test_job", [{"id": "001"}], db_path=db_path) == 1
+        close_db(db_path)
@@ -2,14 +2,21 @@
 
 import pytest
 
+from quarry.tools.polish import transformers
 from quarry.tools.polish.transformers import (
+    apply_batch,
     apply_transformation,
     clean_whitespace,
     extract_domain,
+    extract_number,
+    get_transformation,
     lowercase,
     normalize_text,
     parse_date,
+    register_transform,
     remove_html_tags,
+    to_absolute_url,
+    to_boolean,
     truncate_text,
     uppercase,
 )
@@ -59,6 +66,15 @@ class TestCleanWhitespace:
         """Test non-string returns as-is."""
         assert clean_whitespace(123) == 123  # type: ignore
 
+    def test_already_clean_text_returned_unchanged(self):
+        """Test clean input is returned as the same object."""
+        text = "already clean text"
+        assert clean_whitespace(text) is text
+
+    def test_non_space_whitespace_still_collapsed(self):
+        """Test single tabs, newlines and NBSP are normalized to spaces."""
+        assert clean_whitespace("a\tb\nc\u00a0d") == "a b c d"
+
 
 class TestParseDate:
     """Tests for parse_date function."""
@@ -100,6 +116,25 @@ class TestParseDate:
         """Test invalid date returns None."""
         assert parse_date("not a date") is None
 
+    def test_mixed_formats_after_cached_format(self):
+        """Test alternating formats each parse correctly."""
+        assert parse_date("January 15, 2024") == "2024-01-15"
+        assert parse_date("February 1, 2024") == "2024-02-01"
+        assert parse_date("2024-03-05") == "2024-03-05"
+        assert parse_date("not a date") is None
+
+    def test_iso_shapes_match_strptime(self):
+        """Test the ISO fast path accepts and rejects what strptime would."""
+        assert parse_date("2024-01-15 10:30:00") == "2024-01-15"
+        assert parse_date("2024-1-5") == "2024-01-05"
+        assert parse_date("2024-02-30") is None
+        assert parse_date("2024-01-15T10:30:00Z") is None
+
+    def test_ambiguous_date_keeps_us_precedence(self):
+        """Test a day-first match never makes later ambiguous dates day-first."""
+        assert parse_date("15/01/2024") == "2024-01-15"
+        assert parse_date("01/02/2024") == "2024-01-02"
+
 
 class TestExtractDomain:
     """Tests for extract_domain function."""
@@ -132,6 +167,51 @@ class TestExtractDomain:
         """Test non-string input returns None."""
         assert extract_domain(123) is None  # type: ignore
 
+    def test_query_and_fragment_end_host(self):
+        """Test host ends at query or fragment when there is no path."""
+        assert extract_domain("https://example.com?next=/a/b") == "example.com"
+        assert extract_domain("https://example.com#top/x") == "example.com"
+
+    def test_port_and_userinfo_kept(self):
+        """Test netloc is returned as urlparse reports it."""
+        assert extract_domain("http://www.example.com:8080/x") == "example.com:8080"
+        assert extract_domain("https://user@example.com/x") == "user@example.com"
+
+    def test_urlparse_fallback(self):
+        """Test inputs urlparse rewrites or rejects."""
+        assert extract_domain("https://[::1]:8080/x") == "[::1]:8080"
+        assert extract_domain("https://[::1/x") is None
+        assert extract_domain("https://exa\tmple.com/") == "example.com"
+
+
+class TestExtractNumber:
+    """Tests for extract_number function."""
+
+    def test_currency_and_separators(self):
+        """Test currency symbols and thousands separators are ignored."""
+        assert extract_number("$1,234.56") == 1234.56
+        assert extract_number("Price: 12,345 USD") == 12345.0
+
+    def test_negative_only_when_leading(self):
+        """Test minus sign counts only before any digit."""
+        assert extract_number("-$99.99") == -99.99
+        assert extract_number("1-2-3") == 123.0
+
+    def test_extra_decimal_points_dropped(self):
+        """Test only the first decimal point is kept."""
+        assert extract_number("1.2.3") == 1.23
+
+    def test_non_ascii_input(self):
+        """Test non-ASCII text takes the regex path."""
+        assert extract_number("€ 1.299,00") == 1.299
+        assert extract_number("\u0663 items") is None
+
+    def test_no_number(self):
+        """Test inputs without a number."""
+        assert extract_number("abc") is None
+        assert extract_number(".") is None
+        assert extract_number(None) is None
+
 
 class TestTruncateText:
     """Tests for truncate_text function."""
@@ -221,6 +301,51 @@ class TestLowercase:
         assert lowercase(None) is None
 
 
+class TestToBoolean:
+    """Tests for to_boolean function."""
+
+    def test_recognized_strings(self):
+        """Test recognized strings are case and whitespace insensitive."""
+        assert to_boolean(" Yes ") is True
+        assert to_boolean("ON") is True
+        assert to_boolean("f") is False
+        assert to_boolean("0") is False
+
+    def test_non_string_values(self):
+        """Test bools, ints and None."""
+        assert to_boolean(True) is True
+        assert to_boolean(0) is False
+        assert to_boolean(None) is None
+
+    def test_unrecognized_string(self):
+        """Test unrecognized strings return None."""
+        assert to_boolean("maybe") is None
+
+
+class TestToAbsoluteUrl:
+    """Tests for to_absolute_url function."""
+
+    def test_relative_paths_resolved(self):
+        """Test relative links resolve against the base URL."""
+        base = "https://example.com/catalog/page.html"
+        assert to_absolute_url("/about", base) == "https://example.com/about"
+        assert to_absolute_url("item?id=2", base) == "https://example.com/catalog/item?id=2"
+        assert to_absolute_url("../up", base) == "https://example.com/up"
+
+    def test_repeated_links_same_result(self):
+        """Test cached joins return the same result on repeat calls."""
+        base = "https://example.com/a/"
+        first = to_absolute_url("b", base)
+        assert to_absolute_url("b", base) == first == "https://example.com/a/b"
+        assert to_absolute_url("b", "https://other.org/") == "https://other.org/b"
+
+    def test_absolute_and_missing_inputs(self):
+        """Test absolute URLs, empty base and None input."""
+        assert to_absolute_url("https://x.com/p", "https://example.com") == "https://x.com/p"
+        assert to_absolute_url("/p", "") == "/p"
+        assert to_absolute_url(None, "https://example.com") is None
+
+
 class TestApplyTransformation:
     """Tests for apply_transformation function."""
 
@@ -275,6 +400,67 @@ class TestApplyTransformation:
             apply_transformation("value", "unknown_transform")
         assert "Unknown transformation" in str(exc_info.value)
 
+    def test_get_transformation_resolves_aliases(self):
+        """Test aliases resolve to the same function and unknown names raise."""
+        assert get_transformation("strip_html") is remove_html_tags
+        with pytest.raises(ValueError, match="Unknown transformation"):
+            get_transformation("unknown_transform")
+
+    def test_registered_transform_is_dispatched(self, monkeypatch):
+        """Test custom transforms registered after import are found."""
+        monkeypatch.setattr(transformers, "_DISPATCH", dict(transformers._DISPATCH))
+
+        @register_transform("reverse_text")
+        def reverse_text(value, suffix=""):
+            return value[::-1] + suffix
+
+        assert apply_transformation("abc", "reverse_text") == "cba"
+        assert apply_transformation("abc", "reverse_text", suffix="!") == "cba!"
+
+
+class TestApplyBatch:
+    """Tests for apply_batch function."""
+
+    VALUES = (
+        "  Hello \x0b  <b>World</b>\t",
+        None,
+        "",
+        "   ",
+        "A long sentence that will be cut   here",
+        "Stra\u00dfe  caf\u00e9",
+    )
+
+    @pytest.mark.parametrize(
+        "name",
+        ["normalize_text", "clean_whitespace", "strip_html", "uppercase", "lowercase"],
+    )
+    def test_matches_scalar_transform(self, name):
+        """Test vectorized results equal per-value results."""
+        pa = pytest.importorskip("pyarrow")
+        ascii_values = self.VALUES[:-1]
+        for values in (list(ascii_values), list(self.VALUES)):
+            result = apply_batch(pa.array(values, type=pa.string()), name)
+            assert result.to_pylist() == [apply_transformation(v, name) for v in values]
+
+    def test_truncate_text_with_kwargs(self):
+        """Test truncate_text kernel honours max_length."""
+        pa = pytest.importorskip("pyarrow")
+        values = list(self.VALUES[:-1])
+        result = apply_batch(pa.array(values, type=pa.string()), "truncate_text", max_length=24)
+        assert result.to_pylist() == [truncate_text(v, max_length=24) for v in values]
+
+    def test_transform_without_kernel(self):
+        """Test transforms without a kernel are applied per value."""
+        pa = pytest.importorskip("pyarrow")
+        result = apply_batch(pa.array(["2024-01-15", None]), "parse_date")
+        assert result.to_pylist() == ["2024-01-15", None]
+
+    def test_unknown_transformation_raises(self):
+        """Test unknown transformation raises error."""
+        pa = pytest.importorskip("pyarrow")
+        with pytest.raises(ValueError, match="Unknown transformation"):
+            apply_batch(pa.array(["x"]), "unknown_transform")
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])